@@ -0,0 +1,23 @@
+"""
+Shared pytest setup for the review scraper tests
+"""
+
+import os
+
+# Run numba-decorated helpers as plain Python unless a run opts in, so the
+# default suite pays no JIT compile and coverage sees their bodies.
+# Set NUMBA_DISABLE_JIT=0 to exercise the compiled variants (pytest -m jit).
+os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from src.scraper import ReviewScraper
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    """One scraper, and its session, shared by every test in a module"""
+    return ReviewScraper(delay=0)  # No delay for tests
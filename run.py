@@ -7,8 +7,42 @@ Run from VS Code terminal or command line
 import os
 import sys
 import json
+import argparse
+import asyncio
 from datetime import datetime, timedelta
 import subprocess
+import multiprocessing
+import time
+from itertools import islice
+from functools import lru_cache
+
+try:
+    import ijson
+    _JSON_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    _JSON_ERRORS = (ValueError,)
+
+try:
+    import orjson as _json_fast
+except ImportError:
+    try:
+        import ujson as _json_fast
+    except ImportError:
+        _json_fast = None
+
+from src import scraper
+
+# Scrape jobs running at once, in worker or --isolated child processes. Jobs
+# wait on the network, not the CPU, so this is a target-site politeness cap
+MAX_PARALLEL_JOBS = 4
+
+# No -u: children log to stderr, which Python line-buffers already, and their
+# stdout is discarded
+_CMD_PREFIX = (sys.executable, "src/scraper.py")
+
+# Example presets, editable without touching this script
+EXAMPLES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "examples.json")
 
 def print_header(text):
     """Print formatted header"""
@@ -16,38 +50,409 @@ def print_header(text):
     print(f" {text}")
     print("=" * 60)
 
+@lru_cache(maxsize=1)
+def _load_examples():
+    """Parse the example presets once per process"""
+    with open(EXAMPLES_FILE, 'rb') as f:
+        data = f.read()
+    return tuple(_json_fast.loads(data) if _json_fast is not None else json.loads(data))
+
+def iter_examples():
+    """Yield the example presets in menu order"""
+    yield from _load_examples()
+
+def get_example(number):
+    """Return the 1-based example preset, or None if there is no such example"""
+    if number < 1:
+        return None
+    return next(islice(iter_examples(), number - 1, None), None)
+
+# Output metadata by path, with the mtime it was read at, kept across runs so
+# unchanged outputs are not re-parsed; written by Pool workers too
+METADATA_CACHE = os.path.join("data", "cache", "metadata.json")
+
+def _read_metadata(path):
+    """Parse the metadata block of an output file"""
+    if ijson is not None:
+        # metadata is written first, so stop before any review is decoded
+        with open(path, 'rb') as f:
+            return next(ijson.items(f, 'metadata'))
+    
+    if _json_fast is not None:
+        with open(path, 'rb') as f:
+            return _json_fast.loads(f.read())['metadata']
+    
+    with open(path, 'r') as f:
+        return json.load(f)['metadata']
+
+def _load_metadata_cache():
+    """Read the metadata cache, treating a missing or corrupt file as empty"""
+    try:
+        with open(METADATA_CACHE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _metadata(path):
+    """Load the metadata block of an output file, from the cache if the file is unchanged"""
+    key = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    cache = _load_metadata_cache()
+    entry = cache.get(key)
+    if entry is not None and entry['mtime'] == mtime:
+        return entry['metadata']
+    
+    metadata = _read_metadata(path)
+    
+    # Drop outputs that are gone (merged per-source parts), then swap the file
+    # in whole so concurrent workers never read a half-written cache. A lost
+    # race only costs a re-parse on the next run
+    cache = {k: v for k, v in cache.items() if os.path.exists(k)}
+    cache[key] = {"mtime": mtime, "metadata": metadata}
+    tmp = f"{METADATA_CACHE}.{os.getpid()}.tmp"
+    try:
+        text = json.dumps(cache)
+        os.makedirs(os.path.dirname(METADATA_CACHE), exist_ok=True)
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp, METADATA_CACHE)
+    except (OSError, TypeError, ValueError):
+        pass
+    return metadata
+
+def report_result(returncode, output_file, error):
+    """Print the outcome of a single scrape"""
+    if returncode == 0:
+        print(f"✓ Success! Output saved to {output_file}")
+        
+        # Show sample of output
+        try:
+            metadata = _metadata(output_file)
+            print(f"Total reviews: {metadata['total_reviews']}")
+        except:
+            pass
+    else:
+        print(f"✗ Failed: {error}")
+    
+    return returncode
+
 def run_scraper(company, start_date, end_date, source, output_file):
-    """Run the scraper with given parameters"""
-    cmd = [
-        sys.executable, "src/scraper.py",
+    """Run the scraper with given parameters, returning (returncode, seconds)"""
+    print(f"\nRunning: {company} on {source} ({start_date} to {end_date})")
+    t0 = time.perf_counter()
+    returncode = scraper.run(company=company, start=start_date, end=end_date,
+                             source=source, output=output_file, verbose=True)
+    elapsed = time.perf_counter() - t0
+    return report_result(returncode, output_file, "see scraper.log"), elapsed
+
+async def run_scraper_isolated(company, start_date, end_date, source, output_file, semaphore):
+    """Run the scraper in its own Python process, so a crash can't take down the runner
+
+    Returns (returncode, seconds), not counting time spent waiting on the semaphore.
+    """
+    cmd = _CMD_PREFIX + (
         "--company", company,
         "--start", start_date,
         "--end", end_date,
         "--source", source,
         "--output", output_file,
         "--verbose"
-    ]
+    )
     
-    print(f"\nRunning: {' '.join(cmd)}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    async with semaphore:
+        print(f"\nRunning: {' '.join(cmd)}")
+        t0 = time.perf_counter()
+        # stderr is inherited so progress logs stream live instead of piling up
+        # in memory; the runner prints its own summary, so stdout is dropped
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=subprocess.DEVNULL, stderr=None)
+        await proc.wait()
+        elapsed = time.perf_counter() - t0
     
-    if result.returncode == 0:
-        print(f"✓ Success! Output saved to {output_file}")
-        
-        # Show sample of output
+    return report_result(proc.returncode, output_file, "see log above"), elapsed
+
+async def _run_isolated(jobs):
+    """Run jobs as concurrent child processes, at most MAX_PARALLEL_JOBS at a time"""
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_JOBS)
+    return await asyncio.gather(*[
+        run_scraper_isolated(example['company'], example['start_date'],
+                             example['end_date'], source, output_file, semaphore)
+        for example, source, output_file in jobs
+    ])
+
+def _parse_date(text):
+    """Parse a YYYY-MM-DD date, raising ValueError for anything else"""
+    return datetime.strptime(text, "%Y-%m-%d")
+
+def _validate_source(text):
+    """Check a source, comma-separated sources or "all" against the known sites"""
+    valid = {s.value for s in scraper.Source}
+    sources = {s.strip().lower() for s in text.split(',') if s.strip()}
+    if text.strip().lower() != 'all' and (not sources or sources - valid):
+        raise ValueError(f"source must be 'all' or one of: {', '.join(sorted(valid))}")
+
+def prompt(text, validate):
+    """Ask until the answer passes validate(), before any scrape is started"""
+    while True:
+        value = input(text).strip()
+        try:
+            validate(value)
+            return value
+        except ValueError as e:
+            print(f"✗ Invalid input: {e}")
+
+def _validate_end(start_date):
+    """Build a validator for an end date that must not precede start_date"""
+    def validate(text):
+        if _parse_date(text) < _parse_date(start_date):
+            raise ValueError("end date must not be before the start date")
+    return validate
+
+def split_sources(source, output_file):
+    """Split a comma-separated source (or "all") into one (source, output) job per site"""
+    if source.strip().lower() == 'all':
+        sources = [s.value for s in scraper.Source]
+    else:
+        # dict.fromkeys de-duplicates while keeping order, so no two jobs share a file
+        sources = list(dict.fromkeys(s.strip().lower() for s in source.split(',') if s.strip()))
+    
+    if len(sources) <= 1:
+        return [(source, output_file)]
+    
+    base, ext = os.path.splitext(output_file)
+    return [(s, f"{base}.{s}{ext}") for s in sources]
+
+def merge_outputs(part_files, output_file):
+    """Merge per-source JSON outputs into a single output file"""
+    merged = None
+    for part in part_files:
         try:
-            with open(output_file, 'r') as f:
+            with open(part, 'r') as f:
                 data = json.load(f)
-                print(f"Total reviews: {data['metadata']['total_reviews']}")
-        except:
-            pass
+        except (OSError, ValueError):
+            continue
+        
+        if merged is None:
+            merged = data
+        else:
+            merged['reviews'].extend(data['reviews'])
+            merged['metadata']['sources'].extend(data['metadata']['sources'])
+            merged['metadata']['total_reviews'] += data['metadata']['total_reviews']
+        os.remove(part)
+    
+    if merged is None:
+        print(f"✗ No per-source output to merge into {output_file}")
+        return 1
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(merged, f, indent=2, ensure_ascii=False)
+    print(f"✓ Merged {len(part_files)} sources into {output_file} "
+          f"({merged['metadata']['total_reviews']} reviews)")
+    return 0
+
+def is_cached(example):
+    """Check whether the example's existing output already covers its request"""
+    output_file = example['output']
+    if not os.path.exists(output_file):
+        return False
+    
+    try:
+        metadata = _metadata(output_file)
+    except (OSError, KeyError, StopIteration) + _JSON_ERRORS:
+        return False
+    
+    sources = {source.lower() for source, _ in split_sources(example['source'], output_file)}
+    return (metadata['company'].lower() == example['company'].lower()
+            and metadata['start_date'] <= example['start_date']
+            and metadata['end_date'] >= example['end_date']
+            and sources <= set(metadata['sources']))
+
+def plan_jobs(jobs):
+    """Collapse jobs for the same (company, source) with overlapping dates into one scrape
+
+    Returns a list of (scrape_job, covered) pairs, where covered holds the indices
+    into jobs that the scrape serves. Unmerged jobs are scraped as they are.
+    """
+    groups = {}
+    for i, (example, source, _) in enumerate(jobs):
+        groups.setdefault((example['company'].lower(), source.lower()), []).append(i)
+    
+    plan = []
+    for indices in groups.values():
+        indices.sort(key=lambda i: jobs[i][0]['start_date'])
+        
+        # Sweep the sorted intervals, folding each one into the run it overlaps
+        runs = []
+        for i in indices:
+            if runs and jobs[i][0]['start_date'] <= runs[-1][1]:
+                runs[-1][1] = max(runs[-1][1], jobs[i][0]['end_date'])
+                runs[-1][2].append(i)
+            else:
+                runs.append([jobs[i][0]['start_date'], jobs[i][0]['end_date'], [i]])
+        
+        for start_date, end_date, covered in runs:
+            if len(covered) == 1:
+                plan.append((jobs[covered[0]], covered))
+                continue
+            
+            example, source, output_file = jobs[covered[0]]
+            base, ext = os.path.splitext(output_file)
+            merged = {
+                "name": f"Merged: {example['company']}",
+                "company": example['company'],
+                "start_date": start_date,
+                "end_date": end_date,
+            }
+            plan.append(((merged, source, f"{base}.merged{ext}"), covered))
+    
+    return plan
+
+def carve_output(scrape_file, output_file, start_date, end_date):
+    """Write the reviews of a merged scrape that fall inside one job's date range"""
+    with open(scrape_file, 'r') as f:
+        data = json.load(f)
+    
+    # The scraper's own rule, so a carved output keeps exactly the reviews a
+    # direct scrape of the same range would (undated and non-ISO dates included)
+    in_range = scraper.ReviewScraper._is_date_in_range
+    reviews = [r for r in data['reviews'] if in_range(r.get('date'), start_date, end_date)]
+    data['metadata'].update(start_date=start_date, end_date=end_date,
+                            total_reviews=len(reviews))
+    data['reviews'] = reviews
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    return 0
+
+def settle_plan(jobs, plan, results):
+    """Hand each merged scrape's reviews back to the jobs it stood in for
+
+    Returns one exit code per job. Jobs covered by a failed merged scrape
+    keep a failing code, and no output is carved for them.
+    """
+    returncodes = [1] * len(jobs)
+    for (scrape_job, covered), (returncode, _) in zip(plan, results):
+        if len(covered) == 1:
+            returncodes[covered[0]] = returncode
+            continue
+        
+        if returncode == 0:
+            for i in covered:
+                example, _, output_file = jobs[i]
+                returncodes[i] = carve_output(scrape_job[2], output_file,
+                                              example['start_date'], example['end_date'])
+            os.remove(scrape_job[2])
+    
+    return returncodes
+
+def print_timings(jobs, results, wall):
+    """Print how long each job took, to show which scrape dominates wall time"""
+    print_header("TIMINGS")
+    for (example, source, _), (returncode, elapsed) in zip(jobs, results):
+        status = "✓" if returncode == 0 else "✗"
+        label = f"{example['name']} [{source}]"
+        print(f"{status} {label[:50]:50s} {elapsed:6.1f}s")
+    print(f"  {'Total (sum of jobs)':50s} {sum(e for _, e in results):6.1f}s")
+    print(f"  {'Wall clock':50s} {wall:6.1f}s")
+
+def run_examples(examples, isolated=False, use_cache=False):
+    """Run examples in parallel, one scraper job per (example, source)"""
+    if use_cache:
+        cached = [e for e in examples if is_cached(e)]
+        for example in cached:
+            print(f"✓ Cache hit, skipping {example['name']} ({example['output']})")
+        examples = [e for e in examples if e not in cached]
+    
+    if not examples:
+        return 0
+    
+    jobs = []
+    for example in examples:
+        for source, output_file in split_sources(example['source'], example['output']):
+            jobs.append((example, source, output_file))
+    
+    # Create every output directory up front, before workers start writing
+    dirs = {os.path.dirname(output_file) for _, _, output_file in jobs}
+    for d in dirs - {''}:
+        os.makedirs(d, exist_ok=True)
+    
+    # Overlapping requests for the same company and source are scraped once
+    plan = plan_jobs(jobs)
+    scrape_jobs = [scrape_job for scrape_job, _ in plan]
+    
+    t0 = time.perf_counter()
+    if isolated:
+        results = asyncio.run(_run_isolated(scrape_jobs))
     else:
-        print(f"✗ Failed: {result.stderr}")
+        # Long-lived workers inherit the imported scraper, so requests/bs4 are
+        # loaded once per worker rather than once per job, and parsing runs
+        # outside this process's GIL. JIT-compile once here so forked workers
+        # start with the compiled helpers instead of each compiling them
+        scraper.warmup()
+        processes = min(len(scrape_jobs), MAX_PARALLEL_JOBS)
+        with multiprocessing.Pool(processes=processes) as pool:
+            pending = [
+                pool.apply_async(run_scraper, (example['company'], example['start_date'],
+                                               example['end_date'], source, output_file))
+                for example, source, output_file in scrape_jobs
+            ]
+            results = [result.get() for result in pending]
+    wall = time.perf_counter() - t0
     
-    return result.returncode
+    print_timings(scrape_jobs, results, wall)
+    returncodes = settle_plan(jobs, plan, results)
+    
+    # Stitch multi-source examples back into their requested output file
+    failed = 0
+    for example in examples:
+        parts = split_sources(example['source'], example['output'])
+        codes = [rc for (e, _, _), rc in zip(jobs, returncodes) if e is example]
+        if len(parts) > 1:
+            codes.append(merge_outputs([output_file for _, output_file in parts],
+                                       example['output']))
+        failed += any(codes)
+    
+    return failed
 
 def main():
     """Main runner function"""
+    parser = argparse.ArgumentParser(description='Run review scraper examples')
+    parser.add_argument('--isolated', action='store_true',
+                        help='Run each scrape in its own Python process')
+    parser.add_argument('--force', action='store_true',
+                        help='Scrape again even if USE_CACHE=1 and the output is up to date')
+    parser.add_argument('--example',
+                        help='Run an example by number, or "all", without the interactive menu')
+    parser.add_argument('--company', help='Company for a custom scrape without prompts')
+    parser.add_argument('--start', help='Start date (YYYY-MM-DD) for a custom scrape')
+    parser.add_argument('--end', help='End date (YYYY-MM-DD) for a custom scrape')
+    parser.add_argument('--source', help='Source(s) for a custom scrape, comma-separated or "all"')
+    parser.add_argument('--output', default='outputs/custom.json',
+                        help='Output file for a custom scrape')
+    args = parser.parse_args()
+    
+    if args.example:
+        args.example = args.example.strip().lower()
+    if args.example and args.example != 'all' and not (
+            args.example.isdigit() and get_example(int(args.example))):
+        parser.error(f"--example must be 'all' or an example number from {EXAMPLES_FILE}")
+    
+    if args.company:
+        if not (args.start and args.end and args.source):
+            parser.error("--company also needs --start, --end and --source")
+        try:
+            _parse_date(args.start)
+            _validate_end(args.start)(args.end)
+            _validate_source(args.source)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.start or args.end or args.source:
+        # Otherwise they would be ignored for the interactive menu, which hangs headless runs
+        parser.error("--start/--end/--source require --company")
+    
+    # Reusing earlier outputs is opt-in, and --force always re-scrapes
+    use_cache = os.environ.get('USE_CACHE') == '1' and not args.force
+    
     print_header("PRODUCT REVIEW SCRAPER - VS CODE EDITION")
     print("Built with Visual Studio Code - Complete 2-hour implementation")
     
@@ -55,73 +460,63 @@ def main():
     os.makedirs("outputs", exist_ok=True)
     os.makedirs("data/cache", exist_ok=True)
     
-    # Example runs
-    examples = [
-        {
-            "name": "Example 1: Slack on G2",
-            "company": "Slack",
-            "start_date": "2023-01-01",
-            "end_date": "2023-12-31",
-            "source": "g2",
-            "output": "outputs/slack_g2.json"
-        },
-        {
-            "name": "Example 2: Zoom on Capterra",
-            "company": "Zoom",
-            "start_date": "2023-06-01",
-            "end_date": "2023-12-31",
-            "source": "capterra",
-            "output": "outputs/zoom_capterra.json"
-        },
-        {
-            "name": "Example 3: Microsoft Teams on all sources",
-            "company": "Microsoft Teams",
-            "start_date": "2023-01-01",
-            "end_date": "2023-12-31",
-            "source": "g2,capterra,softwareadvice",
-            "output": "outputs/teams_all.json"
-        },
-        {
-            "name": "Example 4: Notion with SoftwareAdvice (Bonus)",
-            "company": "Notion",
-            "start_date": "2023-07-01",
-            "end_date": "2023-12-31",
-            "source": "softwareadvice",
-            "output": "outputs/notion_softwareadvice.json"
-        }
-    ]
-    
-    print("\nAvailable Examples:")
-    for i, example in enumerate(examples, 1):
-        print(f"{i}. {example['name']}")
-    
-    print("\nSelect example to run (1-4), or 'all' to run all:")
-    choice = input("Your choice: ").strip().lower()
+    # Only fall back to the interactive menu when nothing was passed on the command line
+    if args.example:
+        choice = args.example
+    elif args.company:
+        choice = 'custom'
+    else:
+        print("\nAvailable Examples:")
+        count = 0
+        for count, example in enumerate(iter_examples(), 1):
+            print(f"{count}. {example['name']}")
+        
+        print(f"\nSelect example to run (1-{count}), or 'all' to run all:")
+        choice = input("Your choice: ").strip().lower()
     
     if choice == 'all':
-        for example in examples:
-            print_header(example['name'])
-            run_scraper(**example)
-    elif choice.isdigit() and 1 <= int(choice) <= len(examples):
-        example = examples[int(choice) - 1]
+        print_header("Running all examples in parallel")
+        failed = run_examples(list(iter_examples()), args.isolated, use_cache)
+    elif choice.isdigit() and get_example(int(choice)):
+        example = get_example(int(choice))
         print_header(example['name'])
-        run_scraper(**example)
+        failed = run_examples([example], args.isolated, use_cache)
+    elif args.company:
+        failed = run_examples([{
+            "name": "Custom",
+            "company": args.company,
+            "start_date": args.start,
+            "end_date": args.end,
+            "source": args.source,
+            "output": args.output
+        }], args.isolated, use_cache)
     else:
         print("Running custom scrape...")
         company = input("Company name: ").strip()
-        start_date = input("Start date (YYYY-MM-DD): ").strip()
-        end_date = input("End date (YYYY-MM-DD): ").strip()
-        source = input("Source (g2, capterra, softwareadvice, or comma-separated): ").strip()
+        start_date = prompt("Start date (YYYY-MM-DD): ", _parse_date)
+        end_date = prompt("End date (YYYY-MM-DD): ", _validate_end(start_date))
+        source = prompt("Source (g2, capterra, softwareadvice, or comma-separated): ",
+                        _validate_source)
         output = input("Output file [default: outputs/custom.json]: ").strip()
         
         if not output:
             output = "outputs/custom.json"
         
-        run_scraper(company, start_date, end_date, source, output)
+        failed = run_examples([{
+            "name": "Custom",
+            "company": company,
+            "start_date": start_date,
+            "end_date": end_date,
+            "source": source,
+            "output": output
+        }], args.isolated, use_cache)
     
     print_header("ALL DONE!")
     print("Check the 'outputs' folder for your JSON files.")
     print("Open 'scraper.log' for detailed logging information.")
+    
+    # Non-zero when any example failed, for batch and CI callers
+    sys.exit(1 if failed else 0)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
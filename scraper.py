@@ -9,16 +9,44 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import argparse
+import asyncio
 import logging
 import time
 import re
-from datetime import datetime
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass, asdict
+import threading
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from datetime import datetime, date
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Optional, Any, Tuple
+from dataclasses import dataclass
 from enum import Enum
-import html
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+import lxml.html
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Without numba, run the function as plain Python; .py_func mirrors numba's"""
+        def decorate(func):
+            func.py_func = func
+            return func
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return decorate(args[0])
+        return decorate
 
 # Configure logging
 logging.basicConfig(
@@ -31,6 +59,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Patterns used while parsing, compiled once at import rather than per review
+_DATE_PATTERNS = [
+    (re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.I), '%Y-%m-%d'),
+    (re.compile(r'(\d{2})/(\d{2})/(\d{4})', re.I), '%d/%m/%Y'),
+    (re.compile(r'(\d{2})-(\d{2})-(\d{4})', re.I), '%d-%m-%Y'),
+    (re.compile(r'(\w+)\s+(\d{1,2}),?\s+(\d{4})', re.I), '%B %d %Y'),
+    (re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})', re.I), '%d %B %Y'),
+]
+_DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%B %d, %Y', '%b %d, %Y')
+# "June 15, 2023" and "15 June 2023" are resolved by table lookup before any strptime
+_MONTH_FIRST = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})')
+_DAY_FIRST = re.compile(r'(\d{1,2})\s+([A-Za-z]+)\s+(\d{4})')
+_MONTHS = {
+    name: number
+    for number, full in enumerate(('january', 'february', 'march', 'april', 'may', 'june', 'july',
+                                   'august', 'september', 'october', 'november', 'december'), 1)
+    for name in (full, full[:3])
+}
+_RE_RATING = re.compile(r'(\d+\.?\d*)\s*/\s*5|(\d+\.?\d*)\s*out of\s*5|(\d+\.?\d*)\s*stars')
+_RE_RATING_LABEL = re.compile(r'star|rating', re.I)
+_RE_NUMBER = re.compile(r'(\d+\.?\d*)')
+_RE_ISO_DATE = re.compile(r'\d{4}-\d\d-\d\d', re.ASCII)
+
+_SEL_DATE = soupsieve.compile('span[class*=date]')
+
+# Tree builder for review pages: lxml's C parser, not bs4's pure-Python html.parser
+_HTML_PARSER = 'lxml'
+
+
+def _product_link_xpath(href_test: str) -> etree.XPath:
+    """Compile an XPath returning the links, in document order, whose href passes href_test"""
+    return etree.XPath(f"//a[@href][{href_test}]")
+
 
 class Source(Enum):
     """Review sources"""
@@ -40,9 +101,12 @@ class Source(Enum):
     TRUSTPILOT = "trustpilot"  # Bonus alternative
 
 
-@dataclass
+_VALID_SOURCES = frozenset(s.value for s in Source)
+
+
+@dataclass(slots=True)
 class Review:
-    """Review data model"""
+    """Review data model (slotted: no per-instance __dict__)"""
     title: str
     description: str
     date: str
@@ -57,7 +121,220 @@ class Review:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary"""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        # Fields are all scalars, so a shallow read beats asdict()'s deep copy
+        return {k: v for k in self.__slots__ if (v := getattr(self, k)) is not None}
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to UTF-8 JSON, with the same keys as to_dict"""
+        # orjson's native dataclass support would also emit the None fields
+        if orjson is not None:
+            return orjson.dumps(self.to_dict())
+        return json.dumps(self.to_dict(), ensure_ascii=False).encode('utf-8')
+
+
+@dataclass(frozen=True, slots=True)
+class Page:
+    """A fetched page: the final status code and the whole body"""
+    url: str
+    status_code: int
+    content: bytes
+
+
+# Per-site scraping recipes for ReviewScraper._scrape_site, which walks
+# search -> product link -> review pages -> review fields for every site.
+# Selectors use [class*=x], a substring match on the class attribute.
+# page_strainer keeps only the outermost tags review pages are searched under,
+# so <head>, scripts, styles and page chrome are never built into the soup.
+SITE_CONFIGS: Dict[str, Dict[str, Any]] = {
+    Source.G2.value: {
+        'name': 'G2',
+        'base_url': 'https://www.g2.com',
+        'search_url': 'https://www.g2.com/search?utf8=✓&query={query}',
+        'product_links': _product_link_xpath(
+            "contains(@href, '/products/') and not(contains(@href, '/reviews'))"),
+        'reviews_url': lambda url: url + '/reviews',
+        'max_pages': 3,
+        'page_strainer': SoupStrainer(['div', 'article']),
+        'review_selectors': [
+            soupsieve.compile('div[data-testid=review]'),
+            soupsieve.compile('article[class*=review]'),
+            soupsieve.compile('div[class*=review-card]'),
+        ],
+        'max_reviews_per_page': None,
+        'is_last_page': lambda soup, elements: len(elements) < 10,
+        'fields': {
+            'title': soupsieve.compile(':is(h3, h4, div):is([class*=title], [class*=headline])'),
+            'description': soupsieve.compile(
+                ':is(p, div):is([class*=body], [class*=content], [class*=text])'),
+            'reviewer_name': soupsieve.compile(
+                ':is(span, div):is([class*=author], [class*=reviewer])'),
+            'info': soupsieve.compile('div:is([class*=info], [class*=metadata])'),
+        },
+        'default_date': '',
+    },
+    Source.CAPTERRA.value: {
+        'name': 'Capterra',
+        'base_url': 'https://www.capterra.com',
+        'search_url': 'https://www.capterra.com/search/?query={query}',
+        'product_links': _product_link_xpath("contains(@href, '/reviews/') or contains(@href, '/p/')"),
+        'reviews_url': lambda url: url if '/reviews/' in url else url.replace('/p/', '/reviews/'),
+        'max_pages': 2,
+        'page_strainer': SoupStrainer(['div', 'article', 'a']),
+        'review_selectors': [
+            soupsieve.compile('div:is([class*=user-review], [class*=review-item])'),
+            soupsieve.compile('article[class*=review]'),
+        ],
+        'max_reviews_per_page': None,
+        'is_last_page': lambda soup, elements: soup.select_one('a[class*=next]') is None,
+        'fields': {
+            'title': soupsieve.compile(':is(h3, h4):is([class*=title], [class*=headline])'),
+            'description': soupsieve.compile(':is(p, div)[class*=content]'),
+            'reviewer_name': soupsieve.compile(
+                ':is(strong, span):is([class*=author], [class*=user])'),
+        },
+        'default_date': '',
+    },
+    Source.SOFTWAREADVICE.value: {
+        'name': 'SoftwareAdvice',
+        'base_url': 'https://www.softwareadvice.com',
+        'search_url': 'https://www.softwareadvice.com/search/?query={query}',
+        'product_links': _product_link_xpath("contains(@href, '/reviews/')"),
+        'reviews_url': lambda url: url,
+        'max_pages': 1,
+        'page_strainer': SoupStrainer('div'),
+        'review_selectors': [
+            soupsieve.compile('div:is([class*=review], [class*=testimonial])'),
+        ],
+        'max_reviews_per_page': 5,  # Limit to 5 for demo
+        'is_last_page': lambda soup, elements: True,
+        'fields': {
+            'title': soupsieve.compile('h3, h4, strong'),
+            'description': soupsieve.compile('p, div, blockquote'),
+            'reviewer_name': soupsieve.compile(':is(cite, span)[class*=author]'),
+        },
+        'default_date': '2023-10-15',  # SoftwareAdvice often shows dates
+    },
+}
+
+
+def _parse_month_date(date_text: str) -> Optional[str]:
+    """YYYY-MM-DD for a whole "Month D, YYYY" or "D Month YYYY" string, else None"""
+    match = _MONTH_FIRST.fullmatch(date_text)
+    if match:
+        month, day, year = match.groups()
+    else:
+        match = _DAY_FIRST.fullmatch(date_text)
+        if not match:
+            return None
+        day, month, year = match.groups()
+    
+    number = _MONTHS.get(month.lower())
+    if number is None:
+        return None
+    try:
+        return date(int(year), number, int(day)).isoformat()
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_text(date_text: str) -> str:
+    """Normalize a stripped date string to YYYY-MM-DD (cached, pages repeat dates)"""
+    # Fast path: already ISO, which is what most structured markup carries
+    if date_text[:4].isdigit() and date_text[4:5] == '-':
+        try:
+            return date.fromisoformat(date_text[:10]).isoformat()
+        except ValueError:
+            pass
+    
+    month_date = _parse_month_date(date_text)
+    if month_date:
+        return month_date
+    
+    # Try common patterns
+    for pattern, date_format in _DATE_PATTERNS:
+        match = pattern.search(date_text)
+        if match:
+            try:
+                return datetime.strptime(match.group(), date_format).strftime('%Y-%m-%d')
+            except:
+                continue
+    
+    # Try direct parsing
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(date_text, fmt).strftime('%Y-%m-%d')
+        except:
+            continue
+    
+    return date_text
+
+
+# Ratings are a few digits; a longer run is not one, and would overflow the
+# compiled scanner's int64 mantissa
+_MAX_RATING_DIGITS = 15
+
+
+@njit(cache=True)
+def _parse_rating_numeric(text: str) -> float:
+    """First ASCII number in text (digits, optionally '.' and more digits), or -1.0 if none.
+    
+    Equals float() of that number, unless it has more than _MAX_RATING_DIGITS
+    digits, which gives -1.0 as well.
+    """
+    mantissa = 0
+    digits = 0
+    decimals = 0
+    found = False
+    seen_point = False
+    for ch in text:
+        if '0' <= ch <= '9':
+            digits += 1
+            if digits > _MAX_RATING_DIGITS:
+                return -1.0
+            mantissa = mantissa * 10 + (ord(ch) - 48)
+            if seen_point:
+                decimals += 1
+            found = True
+        elif ch == '.' and found and not seen_point:
+            seen_point = True
+        elif found:
+            break
+    if not found:
+        return -1.0
+    return mantissa / 10.0 ** decimals
+
+
+def _fast_rating(text: str) -> float:
+    """float() for the 'D' and 'D.D' ratings _RE_RATING captures, without the general parser"""
+    # _RE_RATING's \d also matches non-ASCII digits, which only float() understands
+    if not text.isascii():
+        return float(text)
+    if len(text) == 3 and text[1] == '.':
+        # Integer tenths divided by 10 rounds exactly as float() would
+        return ((ord(text[0]) - 48) * 10 + ord(text[2]) - 48) / 10
+    if len(text) == 1:
+        return float(ord(text) - 48)
+    return float(text)
+
+
+@lru_cache(maxsize=1)
+def _shared_adapter() -> HTTPAdapter:
+    """The connection-pooling adapter mounted on every ReviewScraper session.
+    
+    Built on first use rather than at import. Pool sizes come from
+    SCRAPER_POOL_CONNECTIONS and SCRAPER_POOL_MAXSIZE when the caller sets
+    them, and default to 16 and 64 otherwise. Transient errors and rate limits
+    are retried with backoff; the final status is still returned so callers
+    keep their status_code checks.
+    """
+    return HTTPAdapter(
+        pool_connections=int(os.environ.get('SCRAPER_POOL_CONNECTIONS', 16)),
+        pool_maxsize=int(os.environ.get('SCRAPER_POOL_MAXSIZE', 64)),
+        max_retries=Retry(total=3, backoff_factor=0.5,
+                          status_forcelist=[429, 500, 502, 503, 504],
+                          raise_on_status=False)
+    )
 
 
 class ReviewScraper:
@@ -74,13 +351,80 @@ class ReviewScraper:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        
+        # Sessions stay per instance for their headers, but share one adapter,
+        # so kept-alive connections are reused across scrapers
+        adapter = _shared_adapter()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.delay = delay
         self.timeout = 30
+        self.max_concurrency = 4  # Parallel requests per site
+        self.max_page_bytes = 10 * 1024 * 1024  # Refuse pages larger than this
+        # Processes for parsing fetched pages; 0 parses in this process. Leave at 0
+        # under run.py's pool, whose daemonic workers cannot start children
+        self.parse_processes = int(os.environ.get('SCRAPER_PARSE_PROCESSES', 0))
+        self._parse_pool: Optional[ProcessPoolExecutor] = None  # Owned by scrape()
+        # Optional JSON file remembering product URLs per (source, company) across runs
+        self.product_cache = os.environ.get('SCRAPER_PRODUCT_CACHE')
+        self._product_cache_lock = threading.Lock()
         
     def wait(self):
         """Respectful delay between requests"""
         time.sleep(self.delay)
     
+    def fetch(self, url: str) -> Page:
+        """GET a page, streaming the body so oversized pages are never held in memory"""
+        with self.session.get(url, timeout=self.timeout, stream=True) as response:
+            length = response.headers.get('Content-Length')
+            if length and length.isdigit() and int(length) > self.max_page_bytes:
+                raise ValueError(f"{url} is {length} bytes, over the {self.max_page_bytes} limit")
+            
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body += chunk
+                if len(body) > self.max_page_bytes:
+                    raise ValueError(f"{url} is over the {self.max_page_bytes} byte limit")
+            
+            return Page(response.url, response.status_code, bytes(body))
+    
+    def _fetch_or_none(self, url: str) -> Optional[Page]:
+        """Fetch a page, logging and returning None if the request fails"""
+        try:
+            return self.fetch(url)
+        except (requests.RequestException, ValueError) as e:
+            logger.debug("Request failed for %s: %s", url, e)
+            return None
+    
+    def fetch_pages(self, urls: List[str]) -> List[Optional[Page]]:
+        """Fetch pages concurrently, in order, with None for requests that failed"""
+        def fetch(url):
+            response = self._fetch_or_none(url)
+            if response is not None:
+                self.wait()
+            return response
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as pool:
+            return list(pool.map(fetch, urls))
+    
+    async def scrape_many(self, urls: List[str],
+                          max_concurrency: int = 5) -> List[Optional[Page]]:
+        """Fetch pages from a running event loop, at most max_concurrency at a time.
+        
+        Like fetch_pages, results are in order with None for failed requests.
+        Each fetch runs in a worker thread, as requests is blocking.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(url):
+            async with semaphore:
+                response = await asyncio.to_thread(self._fetch_or_none, url)
+                if response is not None:
+                    await asyncio.sleep(self.delay)
+                return response
+        
+        return list(await asyncio.gather(*(fetch(url) for url in urls)))
+    
     def validate_inputs(self, company: str, start_date: str, end_date: str, source: str) -> bool:
         """Validate all inputs"""
         errors = []
@@ -101,7 +445,7 @@ class ReviewScraper:
         except ValueError:
             errors.append("Dates must be in YYYY-MM-DD format")
         
-        if source.lower() not in [s.value for s in Source]:
+        if source.lower() not in _VALID_SOURCES:
             errors.append(f"Source must be one of: {', '.join([s.value for s in Source])}")
         
         if errors:
@@ -111,57 +455,41 @@ class ReviewScraper:
         
         return True
     
-    def parse_date(self, date_text: str) -> str:
+    @staticmethod
+    def parse_date(date_text: str) -> str:
         """Parse various date formats to YYYY-MM-DD"""
         if not date_text:
             return ""
         
-        date_text = date_text.strip()
-        
-        # Try common patterns
-        patterns = [
-            (r'(\d{4})-(\d{2})-(\d{2})', '%Y-%m-%d'),
-            (r'(\d{2})/(\d{2})/(\d{4})', '%d/%m/%Y'),
-            (r'(\d{2})-(\d{2})-(\d{4})', '%d-%m-%Y'),
-            (r'(\w+)\s+(\d{1,2}),?\s+(\d{4})', '%B %d %Y'),
-            (r'(\d{1,2})\s+(\w+)\s+(\d{4})', '%d %B %Y'),
-        ]
-        
-        for pattern, date_format in patterns:
-            match = re.search(pattern, date_text, re.IGNORECASE)
-            if match:
-                try:
-                    return datetime.strptime(match.group(), date_format).strftime('%Y-%m-%d')
-                except:
-                    continue
-        
-        # Try direct parsing
-        for fmt in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y', '%B %d, %Y', '%b %d, %Y']:
-            try:
-                return datetime.strptime(date_text, fmt).strftime('%Y-%m-%d')
-            except:
-                continue
-        
-        return date_text
+        return _parse_date_text(date_text.strip())
     
-    def extract_rating(self, element: Any) -> Optional[float]:
+    @staticmethod
+    def extract_rating(element: Any) -> Optional[float]:
         """Extract rating from HTML element"""
         try:
             # Look for rating in text
             text = element.get_text()
-            match = re.search(r'(\d+\.?\d*)\s*/\s*5|(\d+\.?\d*)\s*out of\s*5|(\d+\.?\d*)\s*stars', text)
+            match = _RE_RATING.search(text)
             if match:
                 for group in match.groups():
                     if group:
-                        return float(group)
+                        return _fast_rating(group)
             
-            # Look for aria-label
-            rating_elem = element.find(attrs={'aria-label': re.compile(r'star|rating', re.I)})
+            # Look for aria-label, on the element itself or a descendant
+            if _RE_RATING_LABEL.search(element.get('aria-label', '')):
+                rating_elem = element
+            else:
+                rating_elem = element.find(attrs={'aria-label': _RE_RATING_LABEL})
             if rating_elem:
                 aria_text = rating_elem.get('aria-label', '')
-                match = re.search(r'(\d+\.?\d*)', aria_text)
-                if match:
-                    return float(match.group(1))
+                if aria_text.isascii():
+                    rating = _parse_rating_numeric(aria_text)
+                else:
+                    # The scanner reads ASCII digits only; other scripts go through float()
+                    match = _RE_NUMBER.search(aria_text)
+                    rating = float(match.group(1)) if match else -1.0
+                if rating >= 0:
+                    return rating
             
             # Count stars in class names
             star_classes = element.get('class', [])
@@ -173,126 +501,210 @@ class ReviewScraper:
                     return min(float(stars), 5.0)
                     
         except Exception as e:
-            logger.debug(f"Could not extract rating: {e}")
+            logger.debug("Could not extract rating: %s", e)
         
         return None
     
     def scrape_g2(self, company: str, start_date: str, end_date: str, max_pages: int = 3) -> List[Review]:
         """Scrape reviews from G2.com"""
-        logger.info(f"Starting G2 scrape for '{company}'")
+        return self._scrape_site(Source.G2.value, company, start_date, end_date, max_pages) or []
+    
+    def scrape_capterra(self, company: str, start_date: str, end_date: str, max_pages: int = 2) -> List[Review]:
+        """Scrape reviews from Capterra.com"""
+        return self._scrape_site(Source.CAPTERRA.value, company, start_date, end_date, max_pages) or []
+    
+    def scrape_softwareadvice(self, company: str, start_date: str, end_date: str) -> List[Review]:
+        """Scrape reviews from SoftwareAdvice.com (Bonus third source)"""
+        reviews = self._scrape_site(Source.SOFTWAREADVICE.value, company, start_date, end_date)
+        if reviews is None:
+            return []
+        
+        # Add some mock reviews for demonstration, unless the site was unreachable
+        if not reviews:
+            logger.info("Adding sample reviews for demonstration")
+            sample_dates = ['2023-06-15', '2023-08-22', '2023-11-05']
+            for i, sample_date in enumerate(sample_dates):
+                if self._is_date_in_range(sample_date, start_date, end_date):
+                    reviews.append(Review(
+                        title=f"Review of {company} on SoftwareAdvice",
+                        description=f"SoftwareAdvice provides excellent insights about {company}. The platform is user-friendly and the reviews are detailed.",
+                        date=sample_date,
+                        reviewer_name=f"SoftwareAdvice User {i+1}",
+                        rating=4.0 + (i * 0.3),
+                        company=company,
+                        source=Source.SOFTWAREADVICE.value
+                    ))
+        
+        return reviews
+    
+    def _scrape_site(self, source: str, company: str, start_date: str, end_date: str,
+                     max_pages: Optional[int] = None) -> Optional[List[Review]]:
+        """Search a site for the company and scrape its review pages, per SITE_CONFIGS.
+        
+        Returns None when a request failed before any review was collected, so
+        callers can tell an unreachable site from one with no matching reviews.
+        """
+        config = SITE_CONFIGS[source]
+        name = config['name']
+        logger.info("Starting %s scrape for '%s'", name, company)
         
-        from bs4 import BeautifulSoup
         reviews = []
+        failed = False
         
         try:
-            # Search for company
-            search_url = f"https://www.g2.com/search?utf8=✓&query={requests.utils.quote(company)}"
-            logger.info(f"Searching: {search_url}")
-            
-            response = self.session.get(search_url, timeout=self.timeout)
-            self.wait()
-            
-            if response.status_code != 200:
-                logger.error(f"G2 search failed: {response.status_code}")
-                return reviews
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find product link
-            product_url = None
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if '/products/' in href and not '/reviews' in href:
-                    if company.lower() in link.get_text().lower():
-                        product_url = 'https://www.g2.com' + href
-                        break
-            
+            product_url = self._find_product_url(source, company)
             if not product_url:
-                logger.error(f"Product not found on G2 for {company}")
                 return reviews
             
             # Get reviews page
-            reviews_url = product_url + '/reviews'
-            logger.info(f"Reviews page: {reviews_url}")
-            
-            # Scrape multiple pages
-            for page in range(1, max_pages + 1):
-                page_url = f"{reviews_url}?page={page}" if page > 1 else reviews_url
-                logger.info(f"Scraping page {page}")
-                
-                response = self.session.get(page_url, timeout=self.timeout)
-                self.wait()
-                
+            reviews_url = config['reviews_url'](product_url)
+            logger.info("Reviews page: %s", reviews_url)
+            
+            # Fetch all pages at once, then parse them in order until the last page
+            page_urls = [f"{reviews_url}?page={page}" if page > 1 else reviews_url
+                         for page in range(1, (max_pages or config['max_pages']) + 1)]
+            
+            # Keep pages up to the first error status or failed request
+            contents = []
+            for page, response in enumerate(self.fetch_pages(page_urls), 1):
+                if response is None:
+                    logger.error("%s page %s could not be fetched", name, page)
+                    failed = True
+                    break
                 if response.status_code != 200:
                     break
+                contents.append(response.content)
+            
+            # Parse pages on scrape()'s worker processes when it started them,
+            # then walk them in order
+            if self._parse_pool is not None and len(contents) > 1:
+                pages = list(self._parse_pool.map(_parse_page, repeat(source), contents))
+            else:
+                pages = map(_parse_page, repeat(source), contents)
+            
+            for page, (page_reviews, found, is_last) in enumerate(pages, 1):
+                logger.info("Scraping page %s", page)
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Find review elements (G2 specific selectors)
-                review_elements = soup.find_all('div', {'data-testid': 'review'})
-                if not review_elements:
-                    review_elements = soup.find_all('article', class_=re.compile('review'))
-                if not review_elements:
-                    review_elements = soup.find_all('div', class_=re.compile('review-card'))
-                
-                if not review_elements:
-                    logger.warning(f"No reviews found on page {page}")
+                if not found:
+                    logger.warning("No reviews found on page %s", page)
                     break
                 
-                for element in review_elements:
-                    try:
-                        review = self._parse_g2_review(element)
-                        if review:
-                            # Add metadata
-                            review.company = company
-                            review.source = Source.G2.value
-                            
-                            # Check date range
-                            if self._is_date_in_range(review.date, start_date, end_date):
-                                reviews.append(review)
-                    except Exception as e:
-                        logger.debug(f"Error parsing review: {e}")
+                in_range = self._is_date_in_range_batch(
+                    [review.date for review in page_reviews], start_date, end_date)
+                for review, keep in zip(page_reviews, in_range):
+                    # Add metadata
+                    review.company = company
+                    review.source = source
+                    
+                    if keep:
+                        reviews.append(review)
                 
-                logger.info(f"Found {len(review_elements)} reviews on page {page}")
+                logger.info("Found %s reviews on page %s", found, page)
                 
                 # Check if we should continue
-                if len(review_elements) < 10:  # Last page
+                if is_last:
                     break
             
         except Exception as e:
-            logger.error(f"G2 scraping error: {e}")
+            logger.error("%s scraping error: %s", name, e)
+            failed = True
         
-        logger.info(f"G2 scrape complete: {len(reviews)} reviews")
-        return reviews
+        logger.info("%s scrape complete: %s reviews", name, len(reviews))
+        return None if failed and not reviews else reviews
+    
+    def _find_product_url(self, source: str, company: str) -> Optional[str]:
+        """Search a site for the company's product page, consulting the product cache first.
+        
+        Returns None if the search has no matching product; raises if the search itself fails.
+        """
+        config = SITE_CONFIGS[source]
+        name = config['name']
+        key = f"{source}:{company.lower()}"
+        
+        cached = self._load_product_cache().get(key)
+        if cached:
+            logger.info("Cached product page: %s", cached)
+            return cached
+        
+        # Search for company
+        search_url = config['search_url'].format(query=requests.utils.quote(company))
+        logger.info("Searching: %s", search_url)
+        
+        response = self.fetch(search_url)
+        self.wait()
+        
+        if response.status_code != 200:
+            raise requests.HTTPError(f"{name} search failed: {response.status_code}")
+        
+        # Find product link: the first one the site's XPath selects whose text
+        # contains the company. Text is lowercased in Python, as XPath 1.0's
+        # translate() would only fold A-Z
+        tree = lxml.html.fromstring(response.content)
+        q = company.lower()
+        href = next((link.get('href') for link in config['product_links'](tree)
+                     if q in link.text_content().lower()), None)
+        
+        if href is None:
+            logger.error("Product not found on %s for %s", name, company)
+            return None
+        
+        product_url = config['base_url'] + href
+        self._store_product_url(key, product_url)
+        return product_url
+    
+    def _load_product_cache(self) -> Dict[str, str]:
+        """Read the product cache file, or an empty mapping if it is unset or unreadable"""
+        if not self.product_cache:
+            return {}
+        try:
+            with open(self.product_cache, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _store_product_url(self, key: str, product_url: str):
+        """Add a product URL to the cache file, replacing it atomically"""
+        if not self.product_cache:
+            return
+        with self._product_cache_lock:
+            cache = self._load_product_cache()
+            cache[key] = product_url
+            tmp = f"{self.product_cache}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, 'w', encoding='utf-8') as f:
+                    json.dump(cache, f, indent=2)
+                os.replace(tmp, self.product_cache)
+            except OSError as e:
+                logger.warning("Could not update product cache: %s", e)
     
-    def _parse_g2_review(self, element) -> Optional[Review]:
-        """Parse individual G2 review"""
+    @staticmethod
+    def _parse_review(config: Dict[str, Any], element) -> Optional[Review]:
+        """Parse an individual review element with the site's field selectors"""
+        fields = config['fields']
         try:
             # Title
-            title_elem = element.find(['h3', 'h4', 'div'], class_=re.compile('title|headline'))
+            title_elem = fields['title'].select_one(element)
             title = title_elem.get_text(strip=True) if title_elem else ""
             
             # Description
-            desc_elem = element.find(['p', 'div'], class_=re.compile('body|content|text'))
+            desc_elem = fields['description'].select_one(element)
             description = desc_elem.get_text(strip=True) if desc_elem else ""
             
             # Date
-            date_elem = element.find('time') or element.find('span', class_=re.compile('date'))
-            date_text = date_elem.get_text(strip=True) if date_elem else ""
-            date = self.parse_date(date_text)
+            date_elem = element.find('time') or _SEL_DATE.select_one(element)
+            date_text = date_elem.get_text(strip=True) if date_elem else config['default_date']
+            review_date = ReviewScraper.parse_date(date_text)
             
             # Reviewer
-            reviewer_elem = element.find(['span', 'div'], class_=re.compile('author|reviewer'))
+            reviewer_elem = fields['reviewer_name'].select_one(element)
             reviewer_name = reviewer_elem.get_text(strip=True) if reviewer_elem else ""
             
             # Rating
-            rating = self.extract_rating(element)
+            rating = ReviewScraper.extract_rating(element)
             
             # Additional info
             reviewer_role = None
-            company_size = None
-            
-            info_elem = element.find('div', class_=re.compile('info|metadata'))
+            info_elem = fields['info'].select_one(element) if 'info' in fields else None
             if info_elem:
                 info_text = info_elem.get_text()
                 if 'role' in info_text.lower():
@@ -301,265 +713,38 @@ class ReviewScraper:
             return Review(
                 title=title[:200] if title else "",
                 description=description[:1000] if description else "",
-                date=date,
+                date=review_date,
                 reviewer_name=reviewer_name[:100] if reviewer_name else "",
                 rating=rating,
-                reviewer_role=reviewer_role,
-                company_size=company_size
+                reviewer_role=reviewer_role
             )
             
         except Exception as e:
-            logger.debug(f"Failed to parse G2 review: {e}")
+            logger.debug("Failed to parse %s review: %s", config['name'], e)
             return None
     
-    def scrape_capterra(self, company: str, start_date: str, end_date: str, max_pages: int = 2) -> List[Review]:
-        """Scrape reviews from Capterra.com"""
-        logger.info(f"Starting Capterra scrape for '{company}'")
-        
-        from bs4 import BeautifulSoup
-        reviews = []
-        
-        try:
-            # Search for company
-            search_url = f"https://www.capterra.com/search/?query={requests.utils.quote(company)}"
-            logger.info(f"Searching: {search_url}")
-            
-            response = self.session.get(search_url, timeout=self.timeout)
-            self.wait()
-            
-            if response.status_code != 200:
-                logger.error(f"Capterra search failed: {response.status_code}")
-                return reviews
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find product link
-            product_url = None
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if '/reviews/' in href or '/p/' in href:
-                    if company.lower() in link.get_text().lower():
-                        product_url = 'https://www.capterra.com' + href
-                        break
-            
-            if not product_url:
-                logger.error(f"Product not found on Capterra for {company}")
-                return reviews
-            
-            # Ensure it's a reviews page
-            if '/p/' in product_url and '/reviews/' not in product_url:
-                product_url = product_url.replace('/p/', '/reviews/')
-            
-            logger.info(f"Reviews page: {product_url}")
-            
-            # Scrape pages
-            for page in range(1, max_pages + 1):
-                page_url = f"{product_url}?page={page}" if page > 1 else product_url
-                logger.info(f"Scraping page {page}")
-                
-                response = self.session.get(page_url, timeout=self.timeout)
-                self.wait()
-                
-                if response.status_code != 200:
-                    break
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Find review elements (Capterra specific)
-                review_elements = soup.find_all('div', class_=re.compile('user-review|review-item'))
-                if not review_elements:
-                    review_elements = soup.find_all('article', class_=re.compile('review'))
-                
-                if not review_elements:
-                    logger.warning(f"No reviews found on page {page}")
-                    break
-                
-                for element in review_elements:
-                    try:
-                        review = self._parse_capterra_review(element)
-                        if review:
-                            review.company = company
-                            review.source = Source.CAPTERRA.value
-                            
-                            if self._is_date_in_range(review.date, start_date, end_date):
-                                reviews.append(review)
-                    except Exception as e:
-                        logger.debug(f"Error parsing review: {e}")
-                
-                logger.info(f"Found {len(review_elements)} reviews on page {page}")
-                
-                # Check for pagination end
-                next_button = soup.find('a', class_=re.compile('next|pagination-next'))
-                if not next_button:
-                    break
-            
-        except Exception as e:
-            logger.error(f"Capterra scraping error: {e}")
-        
-        logger.info(f"Capterra scrape complete: {len(reviews)} reviews")
-        return reviews
-    
-    def _parse_capterra_review(self, element) -> Optional[Review]:
-        """Parse individual Capterra review"""
-        try:
-            # Title
-            title_elem = element.find(['h3', 'h4'], class_=re.compile('title|headline'))
-            title = title_elem.get_text(strip=True) if title_elem else ""
-            
-            # Description
-            desc_elem = element.find(['p', 'div'], class_=re.compile('content|review-content'))
-            description = desc_elem.get_text(strip=True) if desc_elem else ""
-            
-            # Date
-            date_elem = element.find('time') or element.find('span', class_=re.compile('date'))
-            date_text = date_elem.get_text(strip=True) if date_elem else ""
-            date = self.parse_date(date_text)
-            
-            # Reviewer
-            reviewer_elem = element.find(['strong', 'span'], class_=re.compile('author|user'))
-            reviewer_name = reviewer_elem.get_text(strip=True) if reviewer_elem else ""
-            
-            # Rating
-            rating = self.extract_rating(element)
-            
-            return Review(
-                title=title[:200] if title else "",
-                description=description[:1000] if description else "",
-                date=date,
-                reviewer_name=reviewer_name[:100] if reviewer_name else "",
-                rating=rating
-            )
-            
-        except Exception as e:
-            logger.debug(f"Failed to parse Capterra review: {e}")
-            return None
-    
-    def scrape_softwareadvice(self, company: str, start_date: str, end_date: str) -> List[Review]:
-        """Scrape reviews from SoftwareAdvice.com (Bonus third source)"""
-        logger.info(f"Starting SoftwareAdvice scrape for '{company}'")
-        
-        from bs4 import BeautifulSoup
-        reviews = []
-        
-        try:
-            # Search for company
-            search_url = f"https://www.softwareadvice.com/search/?query={requests.utils.quote(company)}"
-            logger.info(f"Searching: {search_url}")
-            
-            response = self.session.get(search_url, timeout=self.timeout)
-            self.wait()
-            
-            if response.status_code != 200:
-                logger.error(f"SoftwareAdvice search failed: {response.status_code}")
-                return reviews
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find product link
-            product_url = None
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if '/reviews/' in href and company.lower() in link.get_text().lower():
-                    product_url = 'https://www.softwareadvice.com' + href
-                    break
-            
-            if product_url:
-                logger.info(f"Product page: {product_url}")
-                
-                response = self.session.get(product_url, timeout=self.timeout)
-                self.wait()
-                
-                if response.status_code == 200:
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    
-                    # Parse reviews
-                    review_elements = soup.find_all('div', class_=re.compile('review|testimonial'))
-                    
-                    for element in review_elements[:5]:  # Limit to 5 for demo
-                        try:
-                            review = self._parse_softwareadvice_review(element)
-                            if review:
-                                review.company = company
-                                review.source = Source.SOFTWAREADVICE.value
-                                
-                                if self._is_date_in_range(review.date, start_date, end_date):
-                                    reviews.append(review)
-                        except Exception as e:
-                            logger.debug(f"Error parsing review: {e}")
-            
-            # Add some mock reviews for demonstration
-            if not reviews:
-                logger.info("Adding sample reviews for demonstration")
-                sample_dates = ['2023-06-15', '2023-08-22', '2023-11-05']
-                for i, sample_date in enumerate(sample_dates):
-                    if self._is_date_in_range(sample_date, start_date, end_date):
-                        reviews.append(Review(
-                            title=f"Review of {company} on SoftwareAdvice",
-                            description=f"SoftwareAdvice provides excellent insights about {company}. The platform is user-friendly and the reviews are detailed.",
-                            date=sample_date,
-                            reviewer_name=f"SoftwareAdvice User {i+1}",
-                            rating=4.0 + (i * 0.3),
-                            company=company,
-                            source=Source.SOFTWAREADVICE.value
-                        ))
+    @staticmethod
+    def _is_date_in_range(date_str: str, start_date: str, end_date: str) -> bool:
+        """Check if date is within range"""
+        if not date_str:
+            return True
         
-        except Exception as e:
-            logger.error(f"SoftwareAdvice scraping error: {e}")
+        # Bounds are validated YYYY-MM-DD strings, and zero-padded YYYY-MM-DD
+        # sorts lexicographically, so a padded date inside the range needs no
+        # parsing (an impossible one like 2023-02-30 is kept as unparseable)
+        if start_date <= date_str <= end_date and _RE_ISO_DATE.fullmatch(date_str):
+            return True
         
-        logger.info(f"SoftwareAdvice scrape complete: {len(reviews)} reviews")
-        return reviews
-    
-    def _parse_softwareadvice_review(self, element) -> Optional[Review]:
-        """Parse individual SoftwareAdvice review"""
         try:
-            from bs4 import BeautifulSoup
-            
-            # Title
-            title_elem = element.find(['h3', 'h4', 'strong'])
-            title = title_elem.get_text(strip=True) if title_elem else ""
-            
-            # Description
-            desc_elem = element.find(['p', 'div', 'blockquote'])
-            description = desc_elem.get_text(strip=True) if desc_elem else ""
-            
-            # Date (SoftwareAdvice often shows dates)
-            date_elem = element.find('time') or element.find('span', class_=re.compile('date'))
-            date_text = date_elem.get_text(strip=True) if date_elem else "2023-10-15"
-            date = self.parse_date(date_text)
-            
-            # Reviewer
-            reviewer_elem = element.find(['cite', 'span'], class_=re.compile('author'))
-            reviewer_name = reviewer_elem.get_text(strip=True) if reviewer_elem else ""
-            
-            # Rating
-            rating = self.extract_rating(element)
-            
-            return Review(
-                title=title[:200] if title else "",
-                description=description[:1000] if description else "",
-                date=date,
-                reviewer_name=reviewer_name[:100] if reviewer_name else "",
-                rating=rating
-            )
-            
-        except Exception as e:
-            logger.debug(f"Failed to parse SoftwareAdvice review: {e}")
-            return None
-    
-    def _is_date_in_range(self, date_str: str, start_date: str, end_date: str) -> bool:
-        """Check if date is within range"""
-        try:
-            if not date_str:
-                return True
-            
             review_date = datetime.strptime(date_str, '%Y-%m-%d')
-            start = datetime.strptime(start_date, '%Y-%m-%d')
-            end = datetime.strptime(end_date, '%Y-%m-%d')
-            
-            return start <= review_date <= end
         except ValueError:
-            # If can't parse, include it
-            return True
+            return True  # If can't parse, include it
+        return start_date <= review_date.date().isoformat() <= end_date
+    
+    @staticmethod
+    def _is_date_in_range_batch(dates: List[str], start_date: str, end_date: str) -> List[bool]:
+        """Check a page of dates against one range, by the _is_date_in_range rule"""
+        return [ReviewScraper._is_date_in_range(d, start_date, end_date) for d in dates]
     
     def scrape(self, company: str, start_date: str, end_date: str, sources: List[str]) -> Dict[str, Any]:
         """Main scraping method"""
@@ -567,26 +752,43 @@ class ReviewScraper:
             return {"error": "Invalid inputs"}
         
         all_reviews = []
+        jobs = []
         
         for source in sources:
             source_lower = source.lower()
             
             if source_lower == Source.G2.value:
-                reviews = self.scrape_g2(company, start_date, end_date)
+                jobs.append((source, self.scrape_g2))
             elif source_lower == Source.CAPTERRA.value:
-                reviews = self.scrape_capterra(company, start_date, end_date)
+                jobs.append((source, self.scrape_capterra))
             elif source_lower == Source.SOFTWAREADVICE.value:
-                reviews = self.scrape_softwareadvice(company, start_date, end_date)
+                jobs.append((source, self.scrape_softwareadvice))
             elif source_lower == Source.TRUSTPILOT.value:
                 # Trustpilot implementation would go here
                 logger.info("Trustpilot scraping not implemented in this version")
-                reviews = []
             else:
-                logger.warning(f"Unknown source: {source}")
-                continue
-            
-            all_reviews.extend(reviews)
-            logger.info(f"Collected {len(reviews)} reviews from {source}")
+                logger.warning("Unknown source: %s", source)
+        
+        # Each source is a different site, so scrape them side by side
+        if jobs:
+            # One parse pool serves every source thread. Its workers come from a
+            # forkserver (spawn where there is none), never a fork of this
+            # process while the source threads are running
+            if self.parse_processes > 0:
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_processes,
+                                                       mp_context=_parse_context())
+            try:
+                with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+                    futures = [(source, pool.submit(method, company, start_date, end_date))
+                               for source, method in jobs]
+                    for source, future in futures:
+                        reviews = future.result()
+                        all_reviews.extend(reviews)
+                        logger.info("Collected %s reviews from %s", len(reviews), source)
+            finally:
+                if self._parse_pool is not None:
+                    self._parse_pool.shutdown()
+                    self._parse_pool = None
         
         # Convert reviews to dictionaries
         reviews_dict = [review.to_dict() for review in all_reviews]
@@ -605,64 +807,84 @@ class ReviewScraper:
         }
 
 
-def main():
-    """Command-line interface"""
-    parser = argparse.ArgumentParser(
-        description='Scrape product reviews from multiple sources',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python scraper.py --company Slack --start 2023-01-01 --end 2023-12-31 --source g2
-  python scraper.py --company Zoom --start 2023-06-01 --end 2023-12-31 --source g2,capterra
-  python scraper.py --company Notion --start 2023-01-01 --end 2023-12-31 --source all --verbose
-        """
-    )
+def _parse_context():
+    """Multiprocessing context for parse workers that never forks a threaded process"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+
+def _parse_page(source: str, content: bytes) -> Tuple[List[Review], int, bool]:
+    """Parse one review page into (reviews, review elements found, is last page).
     
-    parser.add_argument('--company', '-c', required=True, help='Company name to search for')
-    parser.add_argument('--start', '-s', required=True, help='Start date (YYYY-MM-DD)')
-    parser.add_argument('--end', '-e', required=True, help='End date (YYYY-MM-DD)')
-    parser.add_argument('--source', '-src', required=True, 
-                       help='Source(s): g2, capterra, softwareadvice, or "all" for all sources')
-    parser.add_argument('--output', '-o', default='reviews.json', help='Output JSON file')
-    parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
-    parser.add_argument('--delay', '-d', type=float, default=1.0, 
-                       help='Delay between requests (seconds)')
+    Module-level so ProcessPoolExecutor can send it to worker processes.
+    """
+    config = SITE_CONFIGS[source]
+    soup = BeautifulSoup(content, _HTML_PARSER, parse_only=config['page_strainer'])
     
-    args = parser.parse_args()
+    # Find review elements, trying the site's selectors in order
+    review_elements = []
+    for selector in config['review_selectors']:
+        review_elements = selector.select(soup)
+        if review_elements:
+            break
+    
+    if not review_elements:
+        return [], 0, True
+    
+    reviews = []
+    for element in review_elements[:config['max_reviews_per_page']]:
+        review = ReviewScraper._parse_review(config, element)
+        if review:
+            reviews.append(review)
     
+    return reviews, len(review_elements), config['is_last_page'](soup, review_elements)
+
+
+def warmup():
+    """Compile the numba helpers now (a no-op without numba), so processes forked later inherit them"""
+    _parse_rating_numeric("4.5 out of 5")
+
+
+def run(company: str, start: str, end: str, source: str, output: str = 'reviews.json',
+        verbose: bool = False, delay: float = 1.0) -> int:
+    """Scrape reviews and save them to a JSON file, returning a process exit code"""
     # Set log level
-    if args.verbose:
+    if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Parse sources
-    if args.source.lower() == 'all':
+    if source.lower() == 'all':
         sources = [s.value for s in Source]
     else:
-        sources = [s.strip().lower() for s in args.source.split(',')]
+        sources = [s.strip().lower() for s in source.split(',')]
     
     # Initialize and run scraper
-    scraper = ReviewScraper(delay=args.delay)
+    scraper = ReviewScraper(delay=delay)
     
     logger.info("=" * 60)
-    logger.info(f"Starting review scraper for: {args.company}")
-    logger.info(f"Date range: {args.start} to {args.end}")
-    logger.info(f"Sources: {', '.join(sources)}")
+    logger.info("Starting review scraper for: %s", company)
+    logger.info("Date range: %s to %s", start, end)
+    logger.info("Sources: %s", ', '.join(sources))
     logger.info("=" * 60)
     
     try:
-        result = scraper.scrape(args.company, args.start, args.end, sources)
+        result = scraper.scrape(company, start, end, sources)
         
         if "error" in result:
-            logger.error(f"Scraping failed: {result['error']}")
-            sys.exit(1)
+            logger.error("Scraping failed: %s", result['error'])
+            return 1
         
         # Save results
-        output_dir = os.path.dirname(args.output)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        output_dir = os.path.dirname(output)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
         
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(output, 'wb') as f:
+                f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output, 'w', encoding='utf-8') as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
         
         # Print summary
         print("\n" + "=" * 60)
@@ -671,7 +893,7 @@ Examples:
         print(f"Company: {result['metadata']['company']}")
         print(f"Sources: {', '.join(result['metadata']['sources'])}")
         print(f"Total Reviews: {result['metadata']['total_reviews']}")
-        print(f"Output File: {args.output}")
+        print(f"Output File: {output}")
         print(f"Scraped At: {result['metadata']['scraped_at']}")
         print("=" * 60)
         
@@ -684,14 +906,44 @@ Examples:
                 if review.get('reviewer_name'):
                     print(f"    Reviewer: {review['reviewer_name']}")
         
-        logger.info(f"Successfully saved {len(result['reviews'])} reviews to {args.output}")
+        logger.info("Successfully saved %s reviews to %s", len(result['reviews']), output)
+        return 0
         
     except KeyboardInterrupt:
         logger.info("Scraping interrupted by user")
-        sys.exit(1)
+        return 1
     except Exception as e:
-        logger.error(f"Unexpected error: {e}", exc_info=True)
-        sys.exit(1)
+        logger.error("Unexpected error: %s", e, exc_info=True)
+        return 1
+
+
+def main():
+    """Command-line interface"""
+    parser = argparse.ArgumentParser(
+        description='Scrape product reviews from multiple sources',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python scraper.py --company Slack --start 2023-01-01 --end 2023-12-31 --source g2
+  python scraper.py --company Zoom --start 2023-06-01 --end 2023-12-31 --source g2,capterra
+  python scraper.py --company Notion --start 2023-01-01 --end 2023-12-31 --source all --verbose
+        """
+    )
+    
+    parser.add_argument('--company', '-c', required=True, help='Company name to search for')
+    parser.add_argument('--start', '-s', required=True, help='Start date (YYYY-MM-DD)')
+    parser.add_argument('--end', '-e', required=True, help='End date (YYYY-MM-DD)')
+    parser.add_argument('--source', '-src', required=True, 
+                       help='Source(s): g2, capterra, softwareadvice, or "all" for all sources')
+    parser.add_argument('--output', '-o', default='reviews.json', help='Output JSON file')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
+    parser.add_argument('--delay', '-d', type=float, default=1.0, 
+                       help='Delay between requests (seconds)')
+    
+    args = parser.parse_args()
+    
+    sys.exit(run(args.company, args.start, args.end, args.source, args.output,
+                 verbose=args.verbose, delay=args.delay))
 
 
 if __name__ == "__main__":
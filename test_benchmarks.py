@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Microbenchmarks for the scraper's per-review hot paths
+Run with: pytest test_benchmarks.py --benchmark-only
+Compare against a saved run with: --benchmark-compare --benchmark-compare-fail=mean:10%
+The default test run skips them with --benchmark-skip; CI compares pull requests
+against their base branch in a separate benchmark job
+"""
+
+import pytest
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("pytest_benchmark")
+
+from bs4 import BeautifulSoup
+
+from src.scraper import _parse_date_text
+
+
+@pytest.mark.parametrize("date_text", ["2023-06-15", "June 15, 2023", "15/06/2023"],
+                         ids=["iso", "month-name", "dmy"])
+def test_bench_parse_date(benchmark, scraper, date_text):
+    """parse_date as called per review, usually an lru_cache hit"""
+    assert benchmark(scraper.parse_date, date_text) == "2023-06-15"
+
+
+@pytest.mark.parametrize("date_text", ["2023-06-15", "June 15, 2023", "15/06/2023"],
+                         ids=["iso", "month-name", "dmy"])
+def test_bench_parse_date_uncached(benchmark, date_text):
+    """The date parsing itself, bypassing the cache"""
+    assert benchmark(_parse_date_text.__wrapped__, date_text) == "2023-06-15"
+
+
+def test_bench_is_date_in_range(benchmark, scraper):
+    """The per-review date range check, for an ISO date inside the range"""
+    assert benchmark(scraper._is_date_in_range, "2023-06-15", "2023-01-01", "2023-12-31")
+
+
+def test_bench_is_date_in_range_batch(benchmark, scraper):
+    """A page's worth of dates checked against the range in one call"""
+    dates = ["2023-06-15", "2022-06-15", ""] * 10
+    assert len(benchmark(scraper._is_date_in_range_batch, dates, "2023-01-01", "2023-12-31")) == 30
+
+
+@pytest.mark.parametrize("html_text", [
+    '<div>4.5 out of 5 stars</div>',
+    '<div><span aria-label="Rating: 4.5"></span></div>',
+], ids=["text", "aria-label"])
+def test_bench_extract_rating(benchmark, scraper, html_text):
+    """extract_rating on the two shapes review pages use, text and aria-label"""
+    element = BeautifulSoup(html_text, 'lxml').div
+    assert benchmark(scraper.extract_rating, element) == 4.5
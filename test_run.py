@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the example runner's job planning and output handling
+Run with: pytest tests/test_run.py -v
+"""
+
+import pytest
+import json
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import run
+
+
+@pytest.fixture(autouse=True)
+def metadata_cache(tmp_path, monkeypatch):
+    """Keep each test's metadata cache out of the working directory"""
+    path = str(tmp_path / "cache" / "metadata.json")
+    monkeypatch.setattr(run, "METADATA_CACHE", path)
+    return path
+
+
+def _example(company="Slack", start="2023-01-01", end="2023-12-31", source="g2", output="out.json"):
+    return {"name": f"{company} {start}", "company": company, "start_date": start,
+            "end_date": end, "source": source, "output": output}
+
+def _write_output(path, company="Slack", start="2023-01-01", end="2023-12-31",
+                  sources=("g2",), reviews=()):
+    data = {
+        "metadata": {"company": company, "start_date": start, "end_date": end,
+                     "sources": list(sources), "total_reviews": len(reviews)},
+        "reviews": list(reviews),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return str(path)
+
+def _read(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def _jobs(*examples, source="g2"):
+    return [(e, source, e["output"]) for e in examples]
+
+
+def test_split_sources_single():
+    """A single source keeps the requested output file"""
+    assert run.split_sources("g2", "out.json") == [("g2", "out.json")]
+
+def test_split_sources_multiple():
+    """Several sources get one suffixed output each, de-duplicated and normalised"""
+    assert run.split_sources(" G2, capterra ,g2", "out/slack.json") == [
+        ("g2", "out/slack.g2.json"), ("capterra", "out/slack.capterra.json")]
+
+def test_split_sources_all():
+    """"all" expands to every known site"""
+    jobs = run.split_sources("All", "out.json")
+    assert [s for s, _ in jobs] == [s.value for s in run.scraper.Source]
+    assert len({f for _, f in jobs}) == len(jobs)
+
+def test_merge_outputs(tmp_path):
+    """Part files are concatenated into the output and removed"""
+    a = _write_output(tmp_path / "o.g2.json", reviews=[{"title": "a"}])
+    b = _write_output(tmp_path / "o.capterra.json", sources=("capterra",),
+                      reviews=[{"title": "b"}, {"title": "c"}])
+    out = tmp_path / "o.json"
+    
+    assert run.merge_outputs([a, b], str(out)) == 0
+    data = _read(out)
+    assert [r["title"] for r in data["reviews"]] == ["a", "b", "c"]
+    assert data["metadata"]["sources"] == ["g2", "capterra"]
+    assert data["metadata"]["total_reviews"] == 3
+    assert not os.path.exists(a) and not os.path.exists(b)
+
+def test_merge_outputs_skips_missing_parts(tmp_path):
+    """A failed source's missing part is skipped; no parts at all is a failure"""
+    a = _write_output(tmp_path / "o.g2.json", reviews=[{"title": "a"}])
+    out = tmp_path / "o.json"
+    
+    assert run.merge_outputs([a, str(tmp_path / "o.capterra.json")], str(out)) == 0
+    assert _read(out)["metadata"]["total_reviews"] == 1
+    assert run.merge_outputs([str(tmp_path / "gone.json")], str(tmp_path / "none.json")) == 1
+    assert not os.path.exists(tmp_path / "none.json")
+
+@pytest.mark.parametrize("example,expected", [
+    ({}, True),
+    ({"company": "SLACK"}, True),
+    ({"start": "2023-03-01", "end": "2023-06-30"}, True),
+    ({"start": "2022-12-31"}, False),
+    ({"end": "2024-01-01"}, False),
+    ({"company": "Zoom"}, False),
+    ({"source": "g2,capterra"}, False),
+])
+def test_is_cached(tmp_path, example, expected):
+    """Cached output must cover the company (any case), dates and every source"""
+    out = _write_output(tmp_path / "out.json")
+    assert run.is_cached(_example(output=out, **example)) is expected
+
+def test_is_cached_missing_or_corrupt(tmp_path):
+    """A missing or unreadable output is never a cache hit"""
+    assert not run.is_cached(_example(output=str(tmp_path / "missing.json")))
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    assert not run.is_cached(_example(output=str(bad)))
+
+def test_metadata_cache_persists(tmp_path, monkeypatch, metadata_cache):
+    """Unchanged outputs are answered from the on-disk cache, changed ones re-parsed"""
+    out = _write_output(tmp_path / "out.json")
+    reads = []
+    read_metadata = run._read_metadata
+    monkeypatch.setattr(run, "_read_metadata", lambda path: reads.append(path) or read_metadata(path))
+    
+    assert run._metadata(out)["company"] == "Slack"
+    assert os.path.exists(metadata_cache)
+    assert run._metadata(out)["company"] == "Slack"
+    assert reads == [out]
+    
+    _write_output(tmp_path / "out.json", company="Zoom")
+    os.utime(out, ns=(0, os.stat(out).st_mtime_ns + 1))
+    assert run._metadata(out)["company"] == "Zoom"
+    assert reads == [out, out]
+
+def test_metadata_cache_drops_removed_outputs(tmp_path, metadata_cache):
+    """Entries for deleted outputs are pruned, and a corrupt cache is rebuilt"""
+    a = _write_output(tmp_path / "a.json")
+    b = _write_output(tmp_path / "b.json")
+    run._metadata(a)
+    os.remove(a)
+    run._metadata(b)
+    assert list(_read(metadata_cache)) == [os.path.abspath(b)]
+    
+    with open(metadata_cache, "w") as f:
+        f.write("{oops")
+    assert run._metadata(b)["company"] == "Slack"
+    assert list(_read(metadata_cache)) == [os.path.abspath(b)]
+
+def test_plan_jobs_overlapping():
+    """Overlapping ranges are scraped once, over their union, into a .merged file"""
+    jobs = _jobs(_example(start="2023-01-01", end="2023-06-30", output="a.json"),
+                 _example(start="2023-03-01", end="2023-09-30", output="b.json"),
+                 _example(start="2023-09-30", end="2023-12-31", output="c.json"))
+    
+    [(scrape_job, covered)] = run.plan_jobs(jobs)
+    merged, source, output_file = scrape_job
+    assert covered == [0, 1, 2]
+    assert (merged["start_date"], merged["end_date"]) == ("2023-01-01", "2023-12-31")
+    assert source == "g2" and output_file == "a.merged.json"
+
+def test_plan_jobs_adjacent():
+    """Ranges that only touch on consecutive days share no date and stay separate"""
+    jobs = _jobs(_example(start="2023-01-01", end="2023-06-30", output="a.json"),
+                 _example(start="2023-07-01", end="2023-12-31", output="b.json"))
+    assert run.plan_jobs(jobs) == [(jobs[0], [0]), (jobs[1], [1])]
+
+def test_plan_jobs_disjoint():
+    """Disjoint ranges are scraped as they are, whatever order they arrive in"""
+    jobs = _jobs(_example(start="2023-09-01", end="2023-12-31", output="a.json"),
+                 _example(start="2023-01-01", end="2023-03-31", output="b.json"))
+    assert run.plan_jobs(jobs) == [(jobs[1], [1]), (jobs[0], [0])]
+
+def test_plan_jobs_mixed_case_company():
+    """Company names group case-insensitively, but different sources never merge"""
+    a = _example(company="Slack", start="2023-01-01", end="2023-06-30", output="a.json")
+    b = _example(company="SLACK", start="2023-06-01", end="2023-12-31", output="b.json")
+    jobs = _jobs(a, b) + [(b, "capterra", "b.capterra.json")]
+    
+    plan = run.plan_jobs(jobs)
+    assert [covered for _, covered in plan] == [[0, 1], [2]]
+    assert plan[0][0][0]["company"] == "Slack"
+
+def test_carve_output(tmp_path):
+    """A carved output keeps what the scraper's own date rule would keep"""
+    reviews = [{"date": d} for d in ("2023-01-15", "2023-05-31", "2023-06-01", "2023-12-01",
+                                     None, "", "2023-3-5", "2023-6-5", "1999-6-1",
+                                     "June 5, 2023")]
+    merged = _write_output(tmp_path / "a.merged.json", reviews=reviews)
+    out = tmp_path / "a.json"
+    
+    assert run.carve_output(merged, str(out), "2023-02-01", "2023-06-01") == 0
+    data = _read(out)
+    assert [r["date"] for r in data["reviews"]] == [
+        "2023-05-31", "2023-06-01", None, "", "2023-3-5", "June 5, 2023"]
+    assert data["metadata"]["start_date"] == "2023-02-01"
+    assert data["metadata"]["end_date"] == "2023-06-01"
+    assert data["metadata"]["total_reviews"] == 6
+
+class InlinePool:
+    """multiprocessing.Pool stand-in that runs jobs inline and records its size"""
+    
+    def __init__(self, processes):
+        self.processes = processes
+        InlinePool.created.append(self)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def apply_async(self, func, args):
+        result = func(*args)
+        return type("Result", (), {"get": lambda self: result})()
+
+
+@pytest.mark.parametrize("sources,processes", [
+    ("g2,capterra", 2),
+    ("all", run.MAX_PARALLEL_JOBS),
+])
+def test_run_examples_pool_not_capped_by_cpus(tmp_path, monkeypatch, sources, processes):
+    """Scrape jobs wait on the network, so even one CPU runs them side by side"""
+    def fake_scraper(company, start_date, end_date, source, output_file):
+        _write_output(output_file, company, start_date, end_date, sources=(source,))
+        return 0, 0.0
+    
+    InlinePool.created = []
+    monkeypatch.setattr(run.os, "cpu_count", lambda: 1)
+    monkeypatch.setattr(run.multiprocessing, "Pool", InlinePool)
+    monkeypatch.setattr(run, "run_scraper", fake_scraper)
+    
+    example = _example(source=sources, output=str(tmp_path / "out.json"))
+    assert run.run_examples([example]) == 0
+    assert [pool.processes for pool in InlinePool.created] == [processes]
+    assert _read(example["output"])["metadata"]["company"] == "Slack"
+
+
+def _main(monkeypatch, *argv):
+    """Run run.main() with argv, recording run_examples calls; prompting fails the test"""
+    calls = []
+    monkeypatch.setattr(sys, "argv", ["run.py", *argv])
+    monkeypatch.setattr(run, "run_examples", lambda examples, *args: calls.append(examples) or 0)
+    monkeypatch.setattr("builtins.input", lambda *args: pytest.fail("main() prompted"))
+    monkeypatch.setattr(os, "makedirs", lambda *args, **kwargs: None)
+    with pytest.raises(SystemExit) as exit_info:
+        run.main()
+    return exit_info.value.code, calls
+
+@pytest.mark.parametrize("argv", [
+    ("--start", "2023-01-01"),
+    ("--end", "2023-12-31"),
+    ("--source", "g2"),
+    ("--start", "2023-01-01", "--end", "2023-12-31", "--source", "g2"),
+])
+def test_main_custom_flags_need_company(monkeypatch, capsys, argv):
+    """Custom-scrape flags without --company are an error, not a fall back to the menu"""
+    code, calls = _main(monkeypatch, *argv)
+    assert code == 2 and calls == []
+    assert "--start/--end/--source require --company" in capsys.readouterr().err
+
+@pytest.mark.parametrize("choice", ["all", "ALL", " All "])
+def test_main_example_all_any_case(monkeypatch, choice):
+    """--example all is accepted in any case and runs every example"""
+    code, calls = _main(monkeypatch, "--example", choice)
+    assert code == 0
+    assert calls == [list(run.iter_examples())]
+
+def test_settle_plan_carves_merged_scrape(tmp_path):
+    """A successful merged scrape is carved into each job's output and removed"""
+    a = _example(start="2023-01-01", end="2023-06-30", output=str(tmp_path / "a.json"))
+    b = _example(start="2023-03-01", end="2023-12-31", output=str(tmp_path / "b.json"))
+    jobs = _jobs(a, b)
+    plan = run.plan_jobs(jobs)
+    merged = plan[0][0][2]
+    _write_output(merged, reviews=[{"date": "2023-02-01"}, {"date": "2023-11-01"}])
+    
+    assert run.settle_plan(jobs, plan, [(0, 1.0)]) == [0, 0]
+    assert [r["date"] for r in _read(a["output"])["reviews"]] == ["2023-02-01"]
+    assert [r["date"] for r in _read(b["output"])["reviews"]] == ["2023-11-01"]
+    assert not os.path.exists(merged)
+
+def test_settle_plan_failed_merged_scrape(tmp_path):
+    """Every job a failed merged scrape stood in for fails, with no output written"""
+    c = _example(company="Zoom", output=str(tmp_path / "c.json"))
+    a = _example(start="2023-01-01", end="2023-06-30", output=str(tmp_path / "a.json"))
+    b = _example(start="2023-03-01", end="2023-12-31", output=str(tmp_path / "b.json"))
+    jobs = _jobs(a, c, b)
+    plan = run.plan_jobs(jobs)
+    assert [covered for _, covered in plan] == [[0, 2], [1]]
+    
+    assert run.settle_plan(jobs, plan, [(1, 1.0), (0, 1.0)]) == [1, 0, 1]
+    assert not os.path.exists(a["output"]) and not os.path.exists(b["output"])
@@ -5,98 +5,525 @@ Run with: pytest tests/test_scraper.py -v
 """
 
 import pytest
+import asyncio
+import io
+import json
+import re
 import sys
 import os
+import threading
+import time
+from functools import lru_cache
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.scraper import ReviewScraper, Review, Source
-
-
-class TestReviewScraper:
-    """Test cases for ReviewScraper"""
-    
-    def setup_method(self):
-        """Setup before each test"""
-        self.scraper = ReviewScraper(delay=0)  # No delay for tests
-    
-    def test_validate_inputs_valid(self):
-        """Test valid inputs"""
-        assert self.scraper.validate_inputs("Slack", "2023-01-01", "2023-12-31", "g2") == True
-    
-    def test_validate_inputs_invalid_date(self):
-        """Test invalid date format"""
-        assert self.scraper.validate_inputs("Slack", "2023-13-01", "2023-12-31", "g2") == False
-    
-    def test_validate_inputs_date_range(self):
-        """Test invalid date range"""
-        assert self.scraper.validate_inputs("Slack", "2023-12-31", "2023-01-01", "g2") == False
-    
-    def test_validate_inputs_invalid_source(self):
-        """Test invalid source"""
-        assert self.scraper.validate_inputs("Slack", "2023-01-01", "2023-12-31", "invalid") == False
-    
-    def test_parse_date_various_formats(self):
-        """Test date parsing with various formats"""
-        test_cases = [
-            ("2023-06-15", "2023-06-15"),
-            ("15/06/2023", "2023-06-15"),
-            ("June 15, 2023", "2023-06-15"),
-            ("15 June 2023", "2023-06-15"),
-            ("", ""),
-        ]
-        
-        for input_date, expected in test_cases:
-            result = self.scraper.parse_date(input_date)
-            assert result == expected
-    
-    def test_is_date_in_range(self):
-        """Test date range checking"""
-        assert self.scraper._is_date_in_range("2023-06-15", "2023-01-01", "2023-12-31") == True
-        assert self.scraper._is_date_in_range("2022-06-15", "2023-01-01", "2023-12-31") == False
-        assert self.scraper._is_date_in_range("", "2023-01-01", "2023-12-31") == True  # Empty date included
-    
-    def test_extract_rating(self):
-        """Test rating extraction"""
-        from bs4 import BeautifulSoup
-        
-        # Test with text
-        html_text = '<div>4.5 out of 5 stars</div>'
-        soup = BeautifulSoup(html_text, 'html.parser')
-        rating = self.scraper.extract_rating(soup.div)
-        assert rating == 4.5
-        
-        # Test with aria-label
-        html_text = '<div aria-label="4.2 stars out of 5"></div>'
-        soup = BeautifulSoup(html_text, 'html.parser')
-        rating = self.scraper.extract_rating(soup.div)
-        assert rating == 4.2
-    
-    def test_review_dataclass(self):
-        """Test Review dataclass"""
-        review = Review(
-            title="Great product",
-            description="Very useful",
-            date="2023-06-15",
-            reviewer_name="John Doe",
-            rating=4.5,
-            source="g2"
-        )
-        
-        assert review.title == "Great product"
-        assert review.rating == 4.5
-        assert review.date == "2023-06-15"
-        
-        # Test to_dict
-        review_dict = review.to_dict()
-        assert review_dict["title"] == "Great product"
-        assert review_dict["rating"] == 4.5
-        assert "source" in review_dict
-    
-    def test_scraper_initialization(self):
-        """Test scraper initialization"""
-        scraper = ReviewScraper(user_agent="TestAgent", delay=2.0)
-        assert scraper.delay == 2.0
-        assert "TestAgent" in scraper.session.headers["User-Agent"]
+import requests
+import src.scraper
+from bs4 import BeautifulSoup
+from bs4.builder import LXMLTreeBuilder
+from lxml import etree
+
+from src.scraper import (ReviewScraper, Review, Page, Source, _DATE_PATTERNS, _parse_rating_numeric,
+                         _shared_adapter, _parse_month_date, _VALID_SOURCES,
+                         _fast_rating, _HTML_PARSER, SITE_CONFIGS,
+                         _parse_page)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def jit_variants(fn):
+    """Parametrize over a numba helper's compiled and pure-Python forms.
+    
+    The .py_func run keeps coverage on the body; the jit run is marked so
+    NUMBA_DISABLE_JIT=0 pytest -m jit checks the compiled path. With the JIT
+    disabled numba.njit returns the bare function, which has no .py_func.
+    """
+    jit_disabled = pytest.mark.skipif(os.environ.get("NUMBA_DISABLE_JIT") == "1",
+                                      reason="JIT disabled by NUMBA_DISABLE_JIT=1")
+    return [
+        pytest.param(fn, marks=[pytest.mark.jit, jit_disabled], id="jit"),
+        pytest.param(getattr(fn, "py_func", fn), id="py"),
+    ]
+
+
+@lru_cache(maxsize=256)
+def _soup(html_text):
+    """Parse a fixture fragment once; tests only read the tree, so it can be shared"""
+    return BeautifulSoup(html_text, _HTML_PARSER)
+
+
+def test_validate_inputs_valid(scraper):
+    """Test valid inputs"""
+    assert scraper.validate_inputs("Slack", "2023-01-01", "2023-12-31", "g2") == True
+
+
+def test_validate_inputs_invalid_date(scraper):
+    """Test invalid date format"""
+    assert scraper.validate_inputs("Slack", "2023-13-01", "2023-12-31", "g2") == False
+
+
+def test_validate_inputs_date_range(scraper):
+    """Test invalid date range"""
+    assert scraper.validate_inputs("Slack", "2023-12-31", "2023-01-01", "g2") == False
+
+
+def test_validate_inputs_invalid_source(scraper):
+    """Test invalid source"""
+    assert scraper.validate_inputs("Slack", "2023-01-01", "2023-12-31", "invalid") == False
+
+
+def test_validate_inputs_source_membership():
+    """Test valid sources are a frozenset derived from the Source enum"""
+    assert type(_VALID_SOURCES) is frozenset
+    assert _VALID_SOURCES == {s.value for s in Source}
+
+
+@pytest.mark.parametrize("input_date, expected", [
+    ("2023-06-15", "2023-06-15"),
+    ("15/06/2023", "2023-06-15"),
+    ("June 15, 2023", "2023-06-15"),
+    ("15 June 2023", "2023-06-15"),
+    ("", ""),
+], ids=["iso", "dmy", "month-name", "dmy-name", "empty"])
+def test_parse_date_various_formats(scraper, input_date, expected):
+    """Test date parsing with various formats"""
+    assert scraper.parse_date(input_date) == expected
+
+
+@pytest.mark.parametrize("input_date, expected", [
+    ("June 15, 2023", "2023-06-15"),
+    ("Jun 15 2023", "2023-06-15"),
+    ("15 June 2023", "2023-06-15"),
+    ("1 sep 2023", "2023-09-01"),
+    ("Sept 15, 2023", None),
+    ("June 31, 2023", None),
+    ("Reviewed June 15, 2023", None),
+    ("2023-06-15", None),
+], ids=["month-first", "abbrev", "day-first", "lowercase", "unknown-month",
+        "invalid-day", "surrounding-text", "iso"])
+def test_parse_month_date(input_date, expected):
+    """Test the month-name table lookup used ahead of strptime"""
+    assert _parse_month_date(input_date) == expected
+
+
+def test_date_patterns_precompiled():
+    """Test date patterns are compiled once at module level"""
+    assert _DATE_PATTERNS
+    for pattern, date_format in _DATE_PATTERNS:
+        assert isinstance(pattern, re.Pattern)
+        assert date_format.startswith('%')
+
+
+def test_is_date_in_range(scraper):
+    """Test date range checking"""
+    assert scraper._is_date_in_range("2023-06-15", "2023-01-01", "2023-12-31") == True
+    assert scraper._is_date_in_range("2022-06-15", "2023-01-01", "2023-12-31") == False
+    assert scraper._is_date_in_range("", "2023-01-01", "2023-12-31") == True  # Empty date included
+    # Sorts inside the range as a string, but January 5th is before the 10th
+    assert scraper._is_date_in_range("2023-1-5", "2023-01-10", "2023-12-31") == False
+
+
+@pytest.mark.parametrize("date_str, expected", [
+    ("2023-01-01", True),
+    ("2023-12-31", True),
+    ("2022-12-31", False),
+    ("2024-01-01", False),
+    ("2023-13-45", True),  # Unparseable, included like any bad date
+    ("2023-6-5", True),  # Unpadded dates are compared as dates, not strings
+    ("2023-1-5", True),
+    ("1999-6-1", False),
+    ("2024-1-1", False),
+], ids=["start", "end", "day-before", "day-after", "invalid",
+        "unpadded-in", "unpadded-jan", "unpadded-before", "unpadded-after"])
+def test_is_date_in_range_lex(scraper, date_str, expected):
+    """Test the ISO string comparison at the range edges"""
+    assert scraper._is_date_in_range(date_str, "2023-01-01", "2023-12-31") == expected
+
+
+def test_is_date_in_range_batch(scraper):
+    """Test batch date range checking matches the scalar check"""
+    dates = ["2023-06-15", "2022-06-15", "", "2024-01-01", "2023-01-01", "2023-12-31",
+             "June 2023", "2023-02-30", "1999-6-1", "2023-1-05"]
+    expected = [True, False, True, False, True, True, True, True, False, True]
+    assert scraper._is_date_in_range_batch(dates, "2023-01-01", "2023-12-31") == expected
+    assert expected == [scraper._is_date_in_range(d, "2023-01-01", "2023-12-31") for d in dates]
+    assert scraper._is_date_in_range_batch([], "2023-01-01", "2023-12-31") == []
+
+
+@pytest.mark.parametrize("html_text, expected", [
+    ('<div>4.5 out of 5 stars</div>', 4.5),
+    ('<div aria-label="4.2 stars out of 5"></div>', 4.2),
+    ('<div><span aria-label="Rating: 3.5"></span></div>', 3.5),
+    ('<div>No rating here</div>', None),
+    ('<div>\u0664.\u0665 out of 5</div>', 4.5),
+    ('<div aria-label="Rating: \u0664.\u0665"></div>', 4.5),
+], ids=["text", "aria-label", "child-aria-label", "missing", "arabic-indic-digits",
+        "arabic-indic-aria-label"])
+def test_extract_rating(scraper, html_text, expected):
+    """Test rating extraction"""
+    assert scraper.extract_rating(_soup(html_text).div) == expected
+
+
+@pytest.mark.parametrize("fn", jit_variants(_parse_rating_numeric))
+@pytest.mark.parametrize("text, expected", [
+    ("4.2 stars out of 5", 4.2),
+    ("Rating: 3.5", 3.5),
+    ("5 stars", 5.0),
+    ("4. stars", 4.0),
+    ("1.2.3", 1.2),
+    ("no rating", -1.0),
+    ("", -1.0),
+    ("123456789012345", 123456789012345.0),
+    ("12345678901234567890123", -1.0),
+    ("Rating 1234567890.1234567", -1.0),
+])
+def test_parse_rating_numeric(fn, text, expected):
+    """Test numeric rating parsing in both the compiled and Python variants"""
+    assert fn(text) == expected
+
+
+@pytest.mark.parametrize("text", ["4.5", "5", "4.2", "3.0", "0.1", "4.25", "10", "4.",
+                                  "\u0664.\u0665", "\u0664", "\uff14.\uff15"])
+def test_fast_rating(text):
+    """Test the short-rating parser is exactly float() on rating-shaped strings"""
+    assert _fast_rating(text) == float(text)
+
+
+def test_fast_rating_all_tenths():
+    """Test every D.D string parses bit-for-bit like float()"""
+    for whole in range(10):
+        for tenth in range(10):
+            text = f"{whole}.{tenth}"
+            assert _fast_rating(text) == float(text), text
+
+
+def test_review_dataclass():
+    """Test Review dataclass"""
+    review = Review(
+        title="Great product",
+        description="Very useful",
+        date="2023-06-15",
+        reviewer_name="John Doe",
+        rating=4.5,
+        source="g2"
+    )
+    
+    assert review.title == "Great product"
+    assert review.rating == 4.5
+    assert review.date == "2023-06-15"
+    
+    # Test to_dict
+    review_dict = review.to_dict()
+    assert review_dict["title"] == "Great product"
+    assert review_dict["rating"] == 4.5
+    assert "source" in review_dict
+
+
+def test_review_to_json_bytes():
+    """Test Review serializes straight to JSON bytes matching to_dict"""
+    review = Review(title="Très bien", description="Useful", date="2023-06-15", rating=4.5)
+    data = review.to_json_bytes()
+    
+    assert isinstance(data, bytes)
+    assert json.loads(data)["rating"] == 4.5
+    assert json.loads(data) == review.to_dict()
+
+
+def test_review_slots():
+    """Test Review is slotted and to_dict reads the slots, skipping unset fields"""
+    review = Review(title="Great product", description="Very useful", date="2023-06-15")
+    
+    assert not hasattr(review, "__dict__")
+    with pytest.raises(AttributeError):
+        review.unknown_field = "value"
+    
+    assert review.to_dict() == {
+        "title": "Great product",
+        "description": "Very useful",
+        "date": "2023-06-15",
+    }
+
+
+def test_parser_backend_is_c(monkeypatch):
+    """Test pages are parsed by lxml's C parser, guarding against a fall back to html.parser"""
+    soups = []
+    
+    def spy(*args, **kwargs):
+        soups.append(BeautifulSoup(*args, **kwargs))
+        return soups[-1]
+    
+    monkeypatch.setattr(src.scraper, "BeautifulSoup", spy)
+    _parse_page("g2", b"<div class='paper'><h3>Title</h3><p>Body text here</p></div>")
+    
+    assert len(soups) == 1
+    assert isinstance(soups[0].builder, LXMLTreeBuilder)
+    for config in SITE_CONFIGS.values():
+        assert isinstance(config['product_links'], etree.XPath)
+
+
+def test_scraper_initialization():
+    """Test scraper initialization"""
+    scraper = ReviewScraper(user_agent="TestAgent", delay=2.0)
+    assert scraper.delay == 2.0
+    assert "TestAgent" in scraper.session.headers["User-Agent"]
+
+
+def test_scrapers_share_adapter():
+    """Test scrapers keep their own headers but share one pooled adapter"""
+    first = ReviewScraper(user_agent="First", delay=0)
+    second = ReviewScraper(user_agent="Second", delay=0)
+    adapter = first.session.get_adapter("https://www.g2.com")
+    assert adapter is second.session.get_adapter("https://www.capterra.com")
+    assert adapter is first.session.get_adapter("http://www.g2.com")
+    assert adapter is _shared_adapter()
+    assert first.session.headers["User-Agent"] == "First"
+    assert second.session.headers["User-Agent"] == "Second"
+
+
+def test_product_url_cache(tmp_path):
+    """Test product URLs are reused from the cache file without searching"""
+    cache_file = str(tmp_path / "products.json")
+    writer = ReviewScraper(delay=0)
+    writer.product_cache = cache_file
+    writer._store_product_url("g2:slack", "https://www.g2.com/products/slack")
+    
+    scraper = ReviewScraper(delay=0)
+    scraper.product_cache = cache_file
+    scraper.session = None  # Any search request would fail
+    assert scraper._find_product_url("g2", "Slack") == "https://www.g2.com/products/slack"
+
+
+
+def _response(url, body, status=200, headers=None):
+    """A requests.Response carrying body, as a session's GET would return it"""
+    response = requests.Response()
+    response.status_code = status
+    response.url = url
+    response.raw = io.BytesIO(body)
+    response.headers.update(headers or {})
+    return response
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+class CannedSession:
+    """Session stand-in serving canned pages by URL.
+    
+    Values are a fixture file name, an HTTP status code, or an exception to
+    raise; any other URL is a 404.
+    """
+    
+    def __init__(self, pages):
+        self.pages = pages
+    
+    def get(self, url, **kwargs):
+        page = self.pages.get(url, 404)
+        if isinstance(page, Exception):
+            raise page
+        if isinstance(page, int):
+            return _response(url, b"", status=page)
+        return _response(url, _fixture(page))
+
+
+G2_SEARCH = "https://www.g2.com/search?utf8=✓&query=Slack"
+CAPTERRA_SEARCH = "https://www.capterra.com/search/?query=Slack"
+SOFTWAREADVICE_SEARCH = "https://www.softwareadvice.com/search/?query=Slack"
+SOFTWAREADVICE_REVIEWS = "https://www.softwareadvice.com/reviews/slack-profile"
+
+
+def _canned_scraper(pages):
+    scraper = ReviewScraper(delay=0)
+    scraper.product_cache = None
+    scraper.session = CannedSession(pages)
+    return scraper
+
+
+def test_scrape_site_g2_canned_pages():
+    """Test G2 search, product link, review fields and date filtering on saved pages"""
+    scraper = _canned_scraper({
+        G2_SEARCH: "g2_search.html",
+        "https://www.g2.com/products/slack/reviews": "g2_reviews.html",
+    })
+    reviews = scraper.scrape_g2("Slack", "2023-01-01", "2023-12-31")
+    
+    assert [r.to_dict() for r in reviews] == [
+        {"title": "Keeps the team connected",
+         "description": "Channels and threads make async work easy.",
+         "date": "2023-06-15", "reviewer_name": "Alex P.", "rating": 4.5,
+         "source": "g2", "company": "Slack", "reviewer_role": "Role: Engineering Manager"},
+        {"title": "Too many notifications", "description": "Hard to focus with constant pings.",
+         "date": "2023-03-03", "reviewer_name": "Sam R.", "rating": 3.0,
+         "source": "g2", "company": "Slack"},
+    ]
+
+
+def test_scrape_site_capterra_canned_pages():
+    """Test Capterra follows the next link across pages and reads aria-label ratings"""
+    scraper = _canned_scraper({
+        CAPTERRA_SEARCH: "capterra_search.html",
+        "https://www.capterra.com/reviews/135003/Slack/": "capterra_reviews_1.html",
+        "https://www.capterra.com/reviews/135003/Slack/?page=2": "capterra_reviews_2.html",
+    })
+    reviews = scraper.scrape_capterra("Slack", "2023-01-01", "2023-12-31")
+    
+    assert [(r.title, r.date, r.reviewer_name, r.rating) for r in reviews] == [
+        ("Our default chat tool", "2023-06-15", "Jordan K.", 4.0),
+        ("Pricey for small teams", "2023-11-15", "Casey L.", 3.5),
+    ]
+    assert {(r.source, r.company) for r in reviews} == {("capterra", "Slack")}
+
+
+def test_scrape_site_softwareadvice_canned_pages():
+    """Test SoftwareAdvice reviews are scraped, not replaced by samples, when found"""
+    scraper = _canned_scraper({
+        SOFTWAREADVICE_SEARCH: "softwareadvice_search.html",
+        SOFTWAREADVICE_REVIEWS: "softwareadvice_reviews.html",
+    })
+    reviews = scraper.scrape_softwareadvice("Slack", "2023-01-01", "2023-12-31")
+    
+    assert [(r.title, r.description, r.date, r.reviewer_name, r.rating) for r in reviews] == [
+        ("Simple and reliable", "Setup took minutes and it just works.", "2023-08-22",
+         "Riley M.", 4.8),
+    ]
+
+
+def test_scrape_softwareadvice_samples_when_nothing_found():
+    """Test sample reviews stand in when the site answers but has no matching reviews"""
+    scraper = _canned_scraper({SOFTWAREADVICE_SEARCH: "capterra_search.html"})
+    reviews = scraper.scrape_softwareadvice("Slack", "2023-01-01", "2023-12-31")
+    
+    assert [r.reviewer_name for r in reviews] == [
+        "SoftwareAdvice User 1", "SoftwareAdvice User 2", "SoftwareAdvice User 3"]
+
+
+@pytest.mark.parametrize("pages", [
+    {SOFTWAREADVICE_SEARCH: requests.ConnectionError("refused")},
+    {SOFTWAREADVICE_SEARCH: 500},
+    {SOFTWAREADVICE_SEARCH: "softwareadvice_search.html",
+     SOFTWAREADVICE_REVIEWS: requests.ConnectionError("reset")},
+], ids=["search-error", "search-500", "reviews-error"])
+def test_scrape_softwareadvice_unreachable(pages):
+    """Test an unreachable site yields no reviews rather than samples"""
+    scraper = _canned_scraper(pages)
+    assert scraper.scrape_softwareadvice("Slack", "2023-01-01", "2023-12-31") == []
+    assert scraper._scrape_site("softwareadvice", "Slack", "2023-01-01", "2023-12-31") is None
+
+
+def test_scrape_parse_processes():
+    """Test one shared parse pool gives the in-process result and is shut down after"""
+    pages = {
+        G2_SEARCH: "g2_search.html",
+        "https://www.g2.com/products/slack/reviews": "g2_reviews.html",
+        CAPTERRA_SEARCH: "capterra_search.html",
+        "https://www.capterra.com/reviews/135003/Slack/": "capterra_reviews_1.html",
+        "https://www.capterra.com/reviews/135003/Slack/?page=2": "capterra_reviews_2.html",
+    }
+    expected = _canned_scraper(pages).scrape("Slack", "2023-01-01", "2023-12-31",
+                                             ["g2", "capterra"])["reviews"]
+    
+    scraper = _canned_scraper(pages)
+    scraper.parse_processes = 2
+    result = scraper.scrape("Slack", "2023-01-01", "2023-12-31", ["g2", "capterra"])
+    
+    assert result["reviews"] == expected
+    assert len(expected) == 4
+    assert scraper._parse_pool is None
+
+
+def test_parse_page_canned_page():
+    """Test _parse_page returns unfiltered reviews, the element count and the last-page flag"""
+    reviews, found, is_last = _parse_page("capterra", _fixture("capterra_reviews_1.html"))
+    assert [r.title for r in reviews] == ["Our default chat tool"]
+    assert (found, is_last) == (1, False)
+    
+    reviews, found, is_last = _parse_page("g2", _fixture("g2_reviews.html"))
+    assert (len(reviews), found, is_last) == (3, 3, True)
+    
+    assert _parse_page("g2", b"<html><body><p>Nothing here</p></body></html>") == ([], 0, True)
+
+
+class SlowSession:
+    """Session stand-in whose GETs take a fixed time and record peak concurrency"""
+    
+    def __init__(self, latency):
+        self.latency = latency
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+    
+    def get(self, url, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.latency)
+        with self.lock:
+            self.active -= 1
+        if url.endswith("/missing"):
+            raise requests.ConnectionError(url)
+        return _response(url, url.encode())
+
+
+def test_scrape_many_parallel():
+    """Test scrape_many overlaps fetches, bounds concurrency and keeps order"""
+    scraper = ReviewScraper(delay=0)
+    scraper.session = SlowSession(latency=0.1)
+    urls = [f"https://example.com/{i}" for i in range(6)] + ["https://example.com/missing"]
+    
+    responses = asyncio.run(scraper.scrape_many(urls, max_concurrency=4))
+    
+    assert [r.content.decode() for r in responses[:-1]] == urls[:-1]
+    assert responses[-1] is None
+    assert scraper.session.peak == 4  # Four fetches overlapped, and never more
+
+
+class SizedSession:
+    """Session stand-in serving one body, optionally declaring a Content-Length"""
+    
+    def __init__(self, body, length=None):
+        self.body = body
+        self.headers = {} if length is None else {"Content-Length": str(length)}
+    
+    def get(self, url, **kwargs):
+        return _response(url, self.body, headers=self.headers)
+
+
+def test_fetch_returns_page():
+    """Test fetch returns the status and the whole body, up to the size cap"""
+    scraper = ReviewScraper(delay=0)
+    scraper.max_page_bytes = 1024
+    scraper.session = SizedSession(b"x" * 1024, length=1024)
+    
+    assert scraper.fetch("https://example.com/") == Page("https://example.com/", 200, b"x" * 1024)
+
+
+@pytest.mark.parametrize("body,length", [
+    (b"x" * 10, 1025),
+    (b"x" * 1025, None),
+    (b"x" * 1025, 10),
+], ids=["content-length", "streamed", "understated-length"])
+def test_fetch_size_cap(body, length):
+    """Test pages over max_page_bytes are refused, whether declared up front or streamed"""
+    scraper = ReviewScraper(delay=0)
+    scraper.max_page_bytes = 1024
+    scraper.session = SizedSession(body, length)
+    
+    with pytest.raises(ValueError, match="limit"):
+        scraper.fetch("https://example.com/")
+    assert scraper.fetch_pages(["https://example.com/"]) == [None]
+
+
+@pytest.mark.parametrize("company", ["Ökonomie", "ÖKONOMIE", "ökonomie"])
+def test_find_product_url_non_ascii_case(company):
+    """Test link text is matched case-insensitively beyond ASCII, as str.lower() does"""
+    scraper = ReviewScraper(delay=0)
+    scraper.product_cache = None
+    scraper.session = SizedSession(
+        "<meta charset='utf-8'><div><a href='/products/other'>Other</a>"
+        "<a href='/products/oekonomie'>ÖKONOMIE Suite</a></div>".encode())
+    
+    assert scraper._find_product_url("g2", company) == "https://www.g2.com/products/oekonomie"
 
 
 if __name__ == "__main__":